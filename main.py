@@ -2,12 +2,16 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow
+from src.ui import ui_styles
 from src.utils.logger import LoggerConfig
 
 def main():
     """主函数，应用程序入口点"""
     app = QApplication(sys.argv)
 
+    # 安装主样式表和应用程序字体（全局设置一次，所有窗口和对话框继承）
+    ui_styles.install(app)
+
     # 定义数据目录的路径
     project_root = os.path.dirname(os.path.abspath(__file__))
     data_path = os.path.join(project_root, "data")
@@ -5,6 +5,7 @@
 
 import os
 import json
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 from PyQt6.QtCore import QSettings
 from ..utils.logger import LoggerConfig, log_exception
@@ -54,6 +55,9 @@ class ConfigManager:
         # 当前配置
         self._config = {}
         
+        # 批量更新期间推迟写盘（见 batch_update）
+        self._batch_depth = 0
+        
         # 加载配置
         self.load_config()
     
@@ -156,7 +160,9 @@ class ConfigManager:
             # 设置值
             config[keys[-1]] = value
             
-            # 自动保存配置
+            # 自动保存配置（批量更新期间由 batch_update 结束时统一保存）
+            if self._batch_depth:
+                return True
             return self.save_config()
             
         except (KeyError, TypeError, AttributeError, OSError, json.JSONEncodeError) as e:
@@ -164,6 +170,24 @@ class ConfigManager:
             log_exception(self.logger, "设置配置值", e)
             return False
     
+    @contextmanager
+    def batch_update(self):
+        """
+        批量更新配置，期间的 set 调用只修改内存，退出时写盘一次
+        
+        用法:
+            with config_manager.batch_update():
+                config_manager.set("a.b", 1)
+                config_manager.set("a.c", 2)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.save_config()
+    
     def get_section(self, section: str) -> Dict[str, Any]:
         """
         获取配置节
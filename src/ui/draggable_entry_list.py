@@ -36,6 +36,11 @@ class DraggableEntryList(QListWidget):
 
         # 启用自定义拖拽处理
         self.setDragEnabled(True)
+
+        # 条目行高一致：统一尺寸免去逐项测量，分批布局避免大列表一次性排版
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.setBatchSize(50)
         
     def set_business_manager(self, business_manager):
         """设置业务管理器引用"""
@@ -377,6 +382,18 @@ class DraggableEntryList(QListWidget):
             self.drag_start_position = event.globalPosition().toPoint()
         super().mousePressEvent(event)
 
+    def contextMenuEvent(self, event):
+        """右键菜单事件：首次右键时才获取菜单辅助类并构建菜单"""
+        helper = getattr(self, '_context_menu_helper', None)
+        if helper is None:
+            main_window = self.window()
+            helper = getattr(main_window, 'context_menu_helper', None)
+            if helper is None:
+                from .context_menu_helper import ContextMenuHelper
+                helper = ContextMenuHelper(main_window)
+            self._context_menu_helper = helper
+        helper.show_entry_context_menu(event.pos())
+
     def restore_main_window_level(self, main_window):
         """恢复主窗口的显示层级"""
         if main_window:
@@ -7,7 +7,7 @@ import os
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMessageBox, QApplication
 from PyQt6.QtCore import Qt, QMimeData, QTimer
 from PyQt6.QtGui import QFont, QBrush, QColor, QDrag
-from .ui_styles import UIStyles
+from .ui_styles import get_enhanced_tree_style
 
 
 class EnhancedCategoryTreeItem(QTreeWidgetItem):
@@ -62,7 +62,7 @@ class EnhancedCategoryTree(QTreeWidget):
         self.setAcceptDrops(False)
 
         # 设置样式
-        self.setStyleSheet(UIStyles.get_enhanced_tree_style())
+        self.setStyleSheet(get_enhanced_tree_style())
     
     def populate_from_data(self, category_data):
         """从分类数据填充树"""
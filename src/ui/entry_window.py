@@ -6,12 +6,15 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QTextEdit, QGroupBox, QFormLayout, QPushButton,
-    QMessageBox, QFrame, QMenuBar, QStatusBar
+    QMessageBox, QMenuBar, QStatusBar
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QAction, QKeySequence, QCloseEvent
 from ..models.entry import Entry
-from .ui_styles import UIStyles
+from .ui_styles import (
+    get_group_box_style, get_menu_bar_style, get_status_bar_style
+)
+from .ui_components import standard_key_sequence, TightVBox
 from ..utils.time_utils import format_datetime_chinese
 from ..utils.text_utils import count_text_stats
 
@@ -42,7 +45,6 @@ class EntryWindow(QMainWindow):
         
         # 初始化UI
         self.setup_window()
-        self.setup_styles()
         self.create_menu_bar()
         self.create_main_content()
         self.create_status_bar()
@@ -65,25 +67,17 @@ class EntryWindow(QMainWindow):
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowCloseButtonHint |
                            Qt.WindowType.WindowMinimizeButtonHint | Qt.WindowType.WindowMaximizeButtonHint)
         
-    def setup_styles(self):
-        """设置窗口样式"""
-        # 设置应用程序字体
-        font = UIStyles.get_application_font()
-        self.setFont(font)
-        
-        # 设置主样式表
-        self.setStyleSheet(UIStyles.get_main_stylesheet())
-        
     def create_menu_bar(self):
         """创建菜单栏"""
         menubar = self.menuBar()
+        menubar.setStyleSheet(get_menu_bar_style())
         
         # 文件菜单
         file_menu = menubar.addMenu('文件(&F)')
         
         # 保存操作
         save_action = QAction('保存(&S)', self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
+        save_action.setShortcut(standard_key_sequence(QKeySequence.StandardKey.Save))
         save_action.triggered.connect(self.save_entry)
         file_menu.addAction(save_action)
         
@@ -91,7 +85,7 @@ class EntryWindow(QMainWindow):
         
         # 关闭窗口
         close_action = QAction('关闭(&C)', self)
-        close_action.setShortcut(QKeySequence.StandardKey.Close)
+        close_action.setShortcut(standard_key_sequence(QKeySequence.StandardKey.Close))
         close_action.triggered.connect(self.close)
         file_menu.addAction(close_action)
         
@@ -100,12 +94,12 @@ class EntryWindow(QMainWindow):
         
         # 撤销/重做
         undo_action = QAction('撤销(&U)', self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        undo_action.setShortcut(standard_key_sequence(QKeySequence.StandardKey.Undo))
         undo_action.triggered.connect(self.undo_content)
         edit_menu.addAction(undo_action)
         
         redo_action = QAction('重做(&R)', self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
+        redo_action.setShortcut(standard_key_sequence(QKeySequence.StandardKey.Redo))
         redo_action.triggered.connect(self.redo_content)
         edit_menu.addAction(redo_action)
         
@@ -114,55 +108,38 @@ class EntryWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(16, 16, 16, 16)
-        main_layout.setSpacing(16)
+        main_layout = TightVBox(central_widget, 16, 16)
         
         # 条目信息区域
         info_group = QGroupBox("条目信息")
-        info_group.setStyleSheet(UIStyles.get_group_box_style())
+        info_group.setObjectName("entryInfoGroup")
+        info_group.setStyleSheet(get_group_box_style())
         info_layout = QFormLayout(info_group)
         info_layout.setSpacing(12)
         info_layout.setContentsMargins(16, 20, 16, 16)
         
-        # 标题输入框
-        title_label = QLabel("标题:")
-        title_label.setStyleSheet(UIStyles.get_form_label_style())
+        # 标题输入框（表单标签由 QFormLayout 直接创建，样式来自全局样式表）
         self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("请输入条目标题...")
-        self.title_edit.setStyleSheet(UIStyles.get_line_edit_style())
-        info_layout.addRow(title_label, self.title_edit)
+        info_layout.addRow("标题:", self.title_edit)
         
         # 标签输入框
-        tags_label = QLabel("标签:")
-        tags_label.setStyleSheet(UIStyles.get_form_label_style())
         self.tags_edit = QLineEdit()
         self.tags_edit.setPlaceholderText("请输入标签，用逗号分隔...")
-        self.tags_edit.setStyleSheet(UIStyles.get_line_edit_style())
-        info_layout.addRow(tags_label, self.tags_edit)
+        info_layout.addRow("标签:", self.tags_edit)
         
         main_layout.addWidget(info_group)
 
         # 条目详细信息区域
         details_group = QGroupBox("详细信息")
-        details_group.setStyleSheet(UIStyles.get_group_box_style())
+        details_group.setStyleSheet(get_group_box_style())
         details_layout = QVBoxLayout(details_group)
         details_layout.setSpacing(8)
         details_layout.setContentsMargins(16, 20, 16, 16)
 
         # 创建详细信息标签
         self.details_info_label = QLabel()
-        self.details_info_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 12px;
-                line-height: 1.4;
-                padding: 8px;
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 6px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        self.details_info_label.setObjectName("detailsInfo")
         self.details_info_label.setWordWrap(True)
         self.details_info_label.setText("加载中...")
         details_layout.addWidget(self.details_info_label)
@@ -171,7 +148,7 @@ class EntryWindow(QMainWindow):
 
         # 内容编辑区域
         content_group = QGroupBox("内容")
-        content_group.setStyleSheet(UIStyles.get_group_box_style())
+        content_group.setStyleSheet(get_group_box_style())
         content_layout = QVBoxLayout(content_group)
         content_layout.setContentsMargins(16, 20, 16, 16)
         content_layout.setSpacing(12)
@@ -179,19 +156,17 @@ class EntryWindow(QMainWindow):
         # 内容编辑器
         self.content_editor = QTextEdit()
         self.content_editor.setPlaceholderText("请输入条目内容...")
-        self.content_editor.setStyleSheet(UIStyles.get_text_edit_style())
         content_layout.addWidget(self.content_editor)
         
         main_layout.addWidget(content_group)
         
         # 按钮区域
-        button_frame = QFrame()
-        button_layout = QHBoxLayout(button_frame)
+        button_layout = QHBoxLayout()
         button_layout.setContentsMargins(0, 0, 0, 0)
         
         # 保存按钮
         self.save_button = QPushButton("保存")
-        self.save_button.setStyleSheet(UIStyles.get_primary_button_style())
+        self.save_button.setProperty("role", "primary")
         self.save_button.clicked.connect(self.save_entry)
         button_layout.addWidget(self.save_button)
         
@@ -199,15 +174,16 @@ class EntryWindow(QMainWindow):
         
         # 删除按钮
         self.delete_button = QPushButton("删除条目")
-        self.delete_button.setStyleSheet(UIStyles.get_danger_button_style())
+        self.delete_button.setProperty("role", "danger")
         self.delete_button.clicked.connect(self.delete_entry)
         button_layout.addWidget(self.delete_button)
         
-        main_layout.addWidget(button_frame)
+        main_layout.addLayout(button_layout)
         
     def create_status_bar(self):
         """创建状态栏"""
         self.status_bar = QStatusBar()
+        self.status_bar.setStyleSheet(get_status_bar_style())
         self.setStatusBar(self.status_bar)
         self.update_status_bar()
         
@@ -1,21 +1,20 @@
 import os
 import json
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
+    QMainWindow, QWidget, QSplitter,
     QMenu, QInputDialog, QMessageBox, QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import Qt, QPoint, QTimer
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction
 from ..core.business_manager import BusinessManager
 from ..core.config_manager import ConfigManager
-from .search_dialog import SearchDialog
-from .settings_dialog import SettingsDialog
-from .ui_styles import UIStyles
-from .ui_components import UIComponents
+from .ui_components import (
+    create_menu_bar, create_tool_bar, create_category_title_label, create_entry_panel,
+    create_editor_panel, create_status_bar, TightHBox, TightVBox
+)
 from .enhanced_category_tree import EnhancedCategoryTree
 from .entry_window_manager import EntryWindowManager
 from .context_menu_helper import ContextMenuHelper
-from .status_indicator import StatusIndicatorBar, StatusType
 from ..utils.logger import LoggerConfig, log_exception
 from ..utils.time_utils import format_datetime_chinese
 from ..utils.text_utils import format_word_count, format_tags_display, count_text_stats
@@ -28,9 +27,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("LoreMaster - 小说辅助工具")
         self.setGeometry(100, 100, 1400, 900)
 
-        # 设置应用样式
-        self.setup_styles()
-
         # 初始化业务管理器
         self.business_manager = BusinessManager(data_path)
         self.data_path = data_path
@@ -55,34 +51,42 @@ class MainWindow(QMainWindow):
 
         # 拖拽模式相关
         self.adjust_action = None  # 调整按钮的引用
+        self.shared_actions = None  # 菜单栏和工具栏共享的动作
 
         # 自动保存相关
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save_current_entry)
         self.auto_save_timer.setSingleShot(True)
 
+        # 标题/标签输入防抖：连续输入只在停顿后触发一次变化处理
+        self.title_change_timer = QTimer(self)
+        self.title_change_timer.setSingleShot(True)
+        self.title_change_timer.setInterval(150)
+        self.title_change_timer.timeout.connect(self.on_title_changed)
+
+        self.tags_change_timer = QTimer(self)
+        self.tags_change_timer.setSingleShot(True)
+        self.tags_change_timer.setInterval(150)
+        self.tags_change_timer.timeout.connect(self.on_tags_changed)
+
         # 创建菜单栏和工具栏
-        UIComponents.create_menu_bar(self)
-        UIComponents.create_tool_bar(self)
+        create_menu_bar(self)
+        create_tool_bar(self)
 
         # 创建主布局
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setContentsMargins(8, 8, 8, 8)
-        main_layout.setSpacing(8)
+        main_layout = TightHBox(central_widget, 8, 8)
 
         # 创建一个水平分割器
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
         # 左侧：分类树面板
         left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setContentsMargins(8, 8, 8, 8)
-        left_layout.setSpacing(12)
+        left_layout = TightVBox(left_panel)
 
         # 分类树标题
-        category_title = UIComponents.create_category_title_label()
+        category_title = create_category_title_label()
         left_layout.addWidget(category_title)
 
         self.category_tree = EnhancedCategoryTree()
@@ -93,14 +97,14 @@ class MainWindow(QMainWindow):
         splitter.addWidget(left_panel)
 
         # 中间：条目列表面板
-        middle_panel, self.entry_list = UIComponents.create_entry_panel(self)
+        middle_panel, self.entry_list = create_entry_panel(self)
         self.entry_list.set_business_manager(self.business_manager)
         self.entry_list.set_entry_window_manager(self.entry_window_manager)
         splitter.addWidget(middle_panel)
 
-        # 右侧：内容编辑器面板
-        right_panel, self.title_edit, self.tags_edit, self.content_editor, self.details_info_label, self.status_indicator_bar = UIComponents.create_editor_panel(self)
-        splitter.addWidget(right_panel)
+        # 右侧：内容编辑器面板（首次选中条目时才真正构建）
+        self.editor_panel = create_editor_panel(self)
+        splitter.addWidget(self.editor_panel)
 
         # 设置分割器的初始大小比例和样式
         splitter.setSizes([280, 320, 700])
@@ -108,10 +112,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(splitter)
 
         # 创建状态栏
-        self.status_bar = UIComponents.create_status_bar(self)
-
-        # 连接信号
-        self.content_editor.textChanged.connect(self.on_content_changed)
+        self.status_bar = create_status_bar(self)
 
         # 显示统计信息
         self.update_status_bar()
@@ -119,21 +120,33 @@ class MainWindow(QMainWindow):
         # 显示欢迎消息
         self.show_status_message("LoreMaster 已就绪", 3000)
 
+    # 编辑器控件由延迟构建的编辑器面板提供，首次访问时构建
+    @property
+    def title_edit(self):
+        return self.editor_panel.title_edit
+
+    @property
+    def tags_edit(self):
+        return self.editor_panel.tags_edit
+
+    @property
+    def content_editor(self):
+        return self.editor_panel.content_editor
+
+    @property
+    def details_info_label(self):
+        return self.editor_panel.details_info_label
+
+    @property
+    def status_indicator_bar(self):
+        return self.editor_panel.status_indicator_bar
+
     def setup_entry_window_manager(self):
         """设置条目窗口管理器"""
         # 连接信号
         self.entry_window_manager.entry_updated_in_window.connect(self.on_entry_updated_in_window)
         self.entry_window_manager.entry_deleted_in_window.connect(self.on_entry_deleted_in_window)
 
-    def setup_styles(self):
-        """设置应用程序样式"""
-        # 设置应用程序字体
-        font = UIStyles.get_application_font()
-        self.setFont(font)
-
-        # 设置主样式表
-        self.setStyleSheet(UIStyles.get_main_stylesheet())
-
     def show_status_message(self, message: str, timeout: int = 5000):
         """在状态栏显示消息
 
@@ -185,6 +198,7 @@ class MainWindow(QMainWindow):
 
     def on_category_selection_changed(self):
         """当分类选择变化时，更新条目列表"""
+        self.flush_pending_field_changes()
         try:
             if self.is_content_modified and self.current_entry:
                 self.save_current_entry()
@@ -234,8 +248,10 @@ class MainWindow(QMainWindow):
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             QMessageBox.warning(self, "错误", f"条目数据格式错误: {e}")
 
+    @pyqtSlot()
     def on_entry_selection_changed(self):
         """当条目选择变化时，更新内容编辑器"""
+        self.flush_pending_field_changes()
         try:
             # 保存当前条目
             if self.is_content_modified and self.current_entry and self.current_category_path:
@@ -297,10 +313,19 @@ class MainWindow(QMainWindow):
     def clear_editor(self):
         """清空编辑器"""
         self.current_entry = None
+        if not self.editor_panel.is_built:
+            # 编辑器尚未构建，无需清空控件
+            self.is_content_modified = False
+            return
+
         self.title_edit.clear()
         self.tags_edit.clear()
         self.content_editor.clear()
         self.details_info_label.setText("请选择一个条目查看详细信息")
+
+        # 清空控件触发的防抖通知不应标记为修改
+        self.title_change_timer.stop()
+        self.tags_change_timer.stop()
         self.is_content_modified = False
 
         # 清除状态指示器
@@ -350,6 +375,7 @@ class MainWindow(QMainWindow):
 
         self.details_info_label.setText(details_text)
 
+    @pyqtSlot()
     def on_content_changed(self):
         """内容变化时的处理"""
         self.is_content_modified = True
@@ -358,24 +384,37 @@ class MainWindow(QMainWindow):
         if self.current_entry:
             self.update_entry_details_realtime()
 
-        # 更新状态指示器
+        # 更新状态指示器（状态指示器模块随编辑面板按需加载，不在启动时导入）
         if self.config_manager.is_status_indicators_enabled():
+            from .status_indicator import StatusType
             self.status_indicator_bar.update_indicator("save_status", StatusType.MODIFIED, "未保存")
 
         # 启动自动保存定时器
         if self.config_manager.is_auto_save_enabled() and self.current_entry:
             self.auto_save_timer.start(self.config_manager.get_auto_save_interval())
 
+    @pyqtSlot()
     def on_title_changed(self):
-        """标题变化时的处理"""
+        """标题变化时的处理（由防抖定时器触发）"""
         self.is_content_modified = True
         self.on_content_changed()  # 复用内容变化的处理逻辑
 
+    @pyqtSlot()
     def on_tags_changed(self):
-        """标签变化时的处理"""
+        """标签变化时的处理（由防抖定时器触发）"""
         self.is_content_modified = True
         self.on_content_changed()  # 复用内容变化的处理逻辑
 
+    def flush_pending_field_changes(self):
+        """立即处理尚未触发的标题/标签防抖通知，避免切换或保存前丢失修改标记"""
+        if self.title_change_timer.isActive():
+            self.title_change_timer.stop()
+            self.on_title_changed()
+        if self.tags_change_timer.isActive():
+            self.tags_change_timer.stop()
+            self.on_tags_changed()
+
+    @pyqtSlot()
     def create_new_entry(self):
         """创建新条目"""
         if not self.current_category_path:
@@ -383,6 +422,7 @@ class MainWindow(QMainWindow):
             return
 
         # 保存当前条目
+        self.flush_pending_field_changes()
         if self.is_content_modified:
             self.save_current_entry()
 
@@ -427,6 +467,12 @@ class MainWindow(QMainWindow):
         if not self.current_entry or not self.current_category_path:
             return False
 
+        # 先处理尚未触发的标题/标签防抖通知，避免其在保存后触发而把条目重新标记为未保存
+        self.flush_pending_field_changes()
+
+        # 状态指示器模块随编辑面板按需加载，不在启动时导入
+        from .status_indicator import StatusType
+
         # 显示保存中状态
         if self.config_manager.is_status_indicators_enabled():
             if is_auto_save:
@@ -523,6 +569,7 @@ class MainWindow(QMainWindow):
                     self.status_indicator_bar.update_indicator("save_status", StatusType.ERROR, "保存失败")
             return False
 
+    @pyqtSlot()
     def save_current_entry(self):
         """保存当前条目"""
         return self._perform_save(is_auto_save=False)
@@ -543,6 +590,7 @@ class MainWindow(QMainWindow):
             self.logger.error(f"刷新分类树显示失败: {e}")
             self.show_operation_result("刷新分类树", False, str(e))
 
+    @pyqtSlot()
     def delete_current_entry(self):
         """删除当前条目"""
         current_item = self.entry_list.currentItem()
@@ -757,6 +805,7 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"创建分类失败: {e}")
 
+    @pyqtSlot()
     def rename_category(self):
         """重命名选中的分类"""
         current_item = self.category_tree.currentItem()
@@ -781,6 +830,7 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"重命名分类失败: {e}")
 
+    @pyqtSlot()
     def delete_category(self):
         """删除选中的分类"""
         current_item = self.category_tree.currentItem()
@@ -822,6 +872,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """窗口关闭事件"""
+        self.flush_pending_field_changes()
         if self.is_content_modified:
             reply = QMessageBox.question(
                 self,
@@ -842,8 +893,12 @@ class MainWindow(QMainWindow):
 
         event.accept()
 
+    @pyqtSlot()
     def open_search_dialog(self):
         """打开搜索对话框"""
+        # 延迟导入，未使用搜索功能时不加载对话框模块
+        from .search_dialog import SearchDialog
+
         dialog = SearchDialog(self.business_manager, self)
         dialog.entry_selected.connect(self.open_entry_from_search)
         dialog.exec()
@@ -886,6 +941,7 @@ class MainWindow(QMainWindow):
                 return found_item
         return None
 
+    @pyqtSlot(bool)
     def toggle_drag_mode(self, checked: bool):
         """切换拖拽排序模式"""
         try:
@@ -926,9 +982,13 @@ class MainWindow(QMainWindow):
             if self.adjust_action:
                 self.adjust_action.setChecked(not checked)
 
+    @pyqtSlot()
     def open_settings_dialog(self):
         """打开设置对话框"""
         try:
+            # 延迟导入，未打开设置时不加载对话框模块
+            from .settings_dialog import SettingsDialog
+
             dialog = SettingsDialog(self.config_manager, self)
             dialog.settings_changed.connect(self.on_settings_changed)
             dialog.exec()
@@ -944,7 +1004,7 @@ class MainWindow(QMainWindow):
             self.config_manager.load_config()
 
             # 更新状态指示器显示
-            if not self.config_manager.is_status_indicators_enabled():
+            if not self.config_manager.is_status_indicators_enabled() and self.editor_panel.is_built:
                 self.status_indicator_bar.clear_all()
 
             # 停止或重新配置自动保存定时器
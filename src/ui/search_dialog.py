@@ -2,15 +2,57 @@
 搜索对话框 - 提供全局搜索功能
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
     QListWidget, QListWidgetItem, QLabel, QCheckBox, QGroupBox,
     QTextEdit, QSplitter, QFrame
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 from ..core.business_manager import BusinessManager
-from .ui_styles import UIStyles
+from .ui_styles import (
+    get_dialog_style, get_base_group_box_style, get_search_input_style,
+    get_base_checkbox_style, get_base_list_widget_style,
+    get_preview_text_edit_style, get_info_label_style, get_current_theme, _themed
+)
+
+
+# 搜索对话框特有样式（含 ${颜色名} 占位符，按当前主题代入配色）
+_SEARCH_DIALOG_EXTRA_STYLE = """
+            QLabel {
+                color: ${text};
+                font-size: 9pt;
+            }
+            QSplitter::handle {
+                background-color: ${border};
+                width: 1px;
+                height: 1px;
+            }
+            QSplitter::handle:hover {
+                background-color: ${border_light};
+            }
+            """
+
+
+# 搜索对话框样式表在每个主题下首次打开对话框时组合一次，之后直接复用
+@lru_cache(maxsize=None)
+def _get_search_dialog_stylesheet(theme: str) -> str:
+    """获取指定主题下的搜索对话框样式表（组合结果按主题缓存）
+
+    Args:
+        theme: 当前主题名称，作为缓存键（各部分样式按当前主题生成）
+    """
+    # 组合所有需要的样式
+    return (
+        get_dialog_style() +
+        get_base_group_box_style() +
+        get_search_input_style() +
+        get_base_checkbox_style() +
+        get_base_list_widget_style() +
+        get_preview_text_edit_style() +
+        _themed(_SEARCH_DIALOG_EXTRA_STYLE)
+    )
 
 
 class SearchDialog(QDialog):
@@ -32,36 +74,7 @@ class SearchDialog(QDialog):
 
     def setup_styles(self):
         """设置搜索对话框样式"""
-        # 设置字体
-        font = UIStyles.get_application_font()
-        self.setFont(font)
-
-        # 组合所有需要的样式
-        style_sheet = (
-            UIStyles.get_dialog_style() +
-            UIStyles.get_base_group_box_style() +
-            UIStyles.get_search_input_style() +
-            UIStyles.get_base_button_style() +
-            UIStyles.get_base_checkbox_style() +
-            UIStyles.get_base_list_widget_style() +
-            UIStyles.get_preview_text_edit_style() +
-            """
-            QLabel {
-                color: #e0e0e0;
-                font-size: 9pt;
-            }
-            QSplitter::handle {
-                background-color: #3f3f46;
-                width: 1px;
-                height: 1px;
-            }
-            QSplitter::handle:hover {
-                background-color: #52525b;
-            }
-            """
-        )
-
-        self.setStyleSheet(style_sheet)
+        self.setStyleSheet(_get_search_dialog_stylesheet(get_current_theme()))
 
     def setup_ui(self):
         """设置用户界面"""
@@ -85,7 +98,7 @@ class SearchDialog(QDialog):
         search_input_layout.addWidget(self.search_input)
 
         self.search_button = QPushButton("搜索")
-        self.search_button.setStyleSheet(UIStyles.get_primary_button_style())
+        self.search_button.setProperty("role", "primary")
         self.search_button.clicked.connect(self.perform_search)
         search_input_layout.addWidget(self.search_button)
 
@@ -139,7 +152,7 @@ class SearchDialog(QDialog):
         # 条目信息
         self.info_label = QLabel("选择一个搜索结果查看预览")
         self.info_label.setWordWrap(True)
-        self.info_label.setStyleSheet(UIStyles.get_info_label_style())
+        self.info_label.setStyleSheet(get_info_label_style())
         preview_layout.addWidget(self.info_label)
 
         # 内容预览
@@ -161,13 +174,13 @@ class SearchDialog(QDialog):
         button_layout.addStretch()
 
         self.open_button = QPushButton("打开条目")
-        self.open_button.setStyleSheet(UIStyles.get_primary_button_style())
+        self.open_button.setProperty("role", "primary")
         self.open_button.clicked.connect(self.open_selected_entry)
         self.open_button.setEnabled(False)
         button_layout.addWidget(self.open_button)
 
         self.close_button = QPushButton("关闭")
-        self.close_button.setStyleSheet(UIStyles.get_secondary_button_style())
+        self.close_button.setProperty("role", "secondary")
         self.close_button.clicked.connect(self.close)
         button_layout.addWidget(self.close_button)
 
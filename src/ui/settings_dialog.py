@@ -4,14 +4,16 @@
 """
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
+    QDialog, QHBoxLayout, QTabWidget, QWidget,
     QGroupBox, QCheckBox, QSpinBox, QLabel, QPushButton,
     QFormLayout, QDialogButtonBox, QMessageBox, QSlider,
     QComboBox, QFrame
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from .ui_styles import UIStyles
+from .ui_styles import (
+    get_tab_widget_style, get_dialog_button_style, get_group_box_style
+)
+from .ui_components import TightVBox
 from ..core.config_manager import ConfigManager
 from ..utils.logger import LoggerConfig
 
@@ -32,30 +34,30 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.setFixedSize(500, 400)
         
-        # 应用样式
-        self.setStyleSheet(UIStyles.get_main_stylesheet())
-        
+        # 构建期间暂停重绘，界面与设置加载完成后一次性完成布局
+        self.setUpdatesEnabled(False)
+
         # 创建界面
         self.setup_ui()
         
         # 加载当前设置
         self.load_settings()
+
+        self.setUpdatesEnabled(True)
     
     def setup_ui(self):
         """设置用户界面"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(16)
+        layout = TightVBox(self, 16, 16)
         
         # 创建标题
         title_label = QLabel("应用程序设置")
-        title_label.setStyleSheet(UIStyles.get_category_title_style())
+        title_label.setObjectName("categoryTitle")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # 创建选项卡
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet(UIStyles.get_tab_widget_style())
+        self.tab_widget.setStyleSheet(get_tab_widget_style())
         
         # 自动保存选项卡
         self.auto_save_tab = AutoSaveSettingsTab(self.config_manager)
@@ -76,7 +78,7 @@ class SettingsDialog(QDialog):
         
         # 重置按钮
         reset_btn = QPushButton("重置默认")
-        reset_btn.setStyleSheet(UIStyles.get_secondary_button_style())
+        reset_btn.setProperty("role", "secondary")
         reset_btn.clicked.connect(self.reset_to_default)
         button_layout.addWidget(reset_btn)
         
@@ -86,7 +88,7 @@ class SettingsDialog(QDialog):
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
-        button_box.setStyleSheet(UIStyles.get_dialog_button_style())
+        button_box.setStyleSheet(get_dialog_button_style())
         button_box.accepted.connect(self.accept_settings)
         button_box.rejected.connect(self.reject)
         button_layout.addWidget(button_box)
@@ -107,10 +109,11 @@ class SettingsDialog(QDialog):
     def accept_settings(self):
         """应用设置并关闭对话框"""
         try:
-            # 保存各个选项卡的设置
-            self.auto_save_tab.save_settings()
-            self.ui_tab.save_settings()
-            self.editor_tab.save_settings()
+            # 保存各个选项卡的设置（合并为一次写盘）
+            with self.config_manager.batch_update():
+                self.auto_save_tab.save_settings()
+                self.ui_tab.save_settings()
+                self.editor_tab.save_settings()
             
             # 发出设置变化信号
             self.settings_changed.emit()
@@ -153,13 +156,11 @@ class AutoSaveSettingsTab(QWidget):
     
     def setup_ui(self):
         """设置界面"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(16)
+        layout = TightVBox(self, 16, 16)
         
         # 自动保存组
         auto_save_group = QGroupBox("自动保存设置")
-        auto_save_group.setStyleSheet(UIStyles.get_group_box_style())
+        auto_save_group.setStyleSheet(get_group_box_style())
         auto_save_layout = QFormLayout(auto_save_group)
         
         # 启用自动保存
@@ -220,13 +221,11 @@ class UISettingsTab(QWidget):
     
     def setup_ui(self):
         """设置界面"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(16)
+        layout = TightVBox(self, 16, 16)
         
         # 界面设置组
         ui_group = QGroupBox("界面设置")
-        ui_group.setStyleSheet(UIStyles.get_group_box_style())
+        ui_group.setStyleSheet(get_group_box_style())
         ui_layout = QFormLayout(ui_group)
         
         # 显示状态指示器
@@ -268,13 +267,11 @@ class EditorSettingsTab(QWidget):
     
     def setup_ui(self):
         """设置界面"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(16)
+        layout = TightVBox(self, 16, 16)
         
         # 编辑器设置组
         editor_group = QGroupBox("编辑器设置")
-        editor_group.setStyleSheet(UIStyles.get_group_box_style())
+        editor_group.setStyleSheet(get_group_box_style())
         editor_layout = QFormLayout(editor_group)
         
         # 自动换行
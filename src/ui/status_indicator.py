@@ -7,6 +7,8 @@ from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 from enum import Enum
+from functools import lru_cache
+from .ui_styles import THEMES, get_application_font_family, get_current_theme
 
 
 class StatusType(Enum):
@@ -19,6 +21,64 @@ class StatusType(Enum):
     SYNCED = "synced"
 
 
+# 各状态的配色与图标：(背景色名, 文本色名, 图标)，颜色名为主题配色中的键
+_STATUS_COLORS = {
+    StatusType.SAVED: ("accent", "text_bright", "✓"),          # 使用软件主色调蓝色
+    StatusType.SAVING: ("secondary", "text_bright", "⟳"),      # 使用软件灰色调
+    StatusType.MODIFIED: ("border_light", "text", "●"),        # 使用软件边框色
+    StatusType.ERROR: ("status_error", "text_bright", "✗"),    # 使用暗红色
+    StatusType.SYNCING: ("accent", "text_bright", "↕"),        # 使用软件主色调
+    StatusType.SYNCED: ("accent", "text_bright", "✓")          # 使用软件主色调
+}
+_DEFAULT_STATUS_COLORS = ("status_unknown", "text_bright", "?")
+
+
+def _build_status_style(bg_color: str, text_color: str, icon: str) -> tuple:
+    """生成单个状态的样式：(常规样式, 淡化样式, 文本样式, 图标样式, 图标)"""
+    normal_qss = f"""
+        QWidget {{
+            background-color: {bg_color};
+            border-radius: 12px;
+            border: 1px solid {bg_color};
+        }}
+    """
+    dim_qss = f"""
+        QWidget {{
+            background-color: {bg_color};
+            border-radius: 12px;
+            border: 1px solid {bg_color};
+            opacity: 0.6;
+        }}
+    """
+    text_qss = f"color: {text_color}; font-weight: 500;"
+    icon_qss = f"""
+        color: {text_color};
+        font-weight: bold;
+        font-size: 12px;
+    """
+    return normal_qss, dim_qss, text_qss, icon_qss, icon
+
+
+# 每个状态在每个主题下的样式只生成一次，所有指示器实例共享
+@lru_cache(maxsize=None)
+def _get_status_style(status_type: StatusType, theme: str) -> tuple:
+    """获取指定主题下某个状态的样式"""
+    colors = THEMES[theme]
+    bg_name, text_name, icon = _STATUS_COLORS.get(status_type, _DEFAULT_STATUS_COLORS)
+    return _build_status_style(colors[bg_name], colors[text_name], icon)
+
+# 指示器文本字体（需在 QApplication 创建之后构造，首次使用时创建）
+_LABEL_FONT = None
+
+
+def _get_label_font() -> QFont:
+    """获取指示器文本字体，所有指示器共享同一个实例"""
+    global _LABEL_FONT
+    if _LABEL_FONT is None:
+        _LABEL_FONT = QFont(get_application_font_family(), 8)
+    return _LABEL_FONT
+
+
 class StatusIndicator(QWidget):
     """单个状态指示器组件"""
     
@@ -43,7 +103,7 @@ class StatusIndicator(QWidget):
         
         # 状态文本
         self.text_label = QLabel(text)
-        self.text_label.setFont(QFont("Segoe UI", 8))
+        self.text_label.setFont(_get_label_font())
         layout.addWidget(self.text_label)
         
         # 设置样式
@@ -56,35 +116,17 @@ class StatusIndicator(QWidget):
     
     def update_appearance(self):
         """更新外观"""
-        colors = {
-            StatusType.SAVED: ("#0e639c", "#ffffff", "✓"),      # 使用软件主色调蓝色
-            StatusType.SAVING: ("#6d6d6d", "#ffffff", "⟳"),     # 使用软件灰色调
-            StatusType.MODIFIED: ("#52525b", "#e0e0e0", "●"),    # 使用软件边框色
-            StatusType.ERROR: ("#8b5a5a", "#ffffff", "✗"),      # 使用暗红色
-            StatusType.SYNCING: ("#0e639c", "#ffffff", "↕"),     # 使用软件主色调
-            StatusType.SYNCED: ("#0e639c", "#ffffff", "✓")      # 使用软件主色调
-        }
-        
-        bg_color, text_color, icon = colors.get(self.status_type, ("#6c757d", "#ffffff", "?"))
-        
+        # 样式字符串按状态类型和当前主题缓存，这里只做查表
+        (self._normal_qss, self._dim_qss,
+         text_qss, icon_qss, icon) = _get_status_style(self.status_type, get_current_theme())
+
         # 设置样式
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                border-radius: 12px;
-                border: 1px solid {bg_color};
-            }}
-        """)
-        
-        self.text_label.setStyleSheet(f"color: {text_color}; font-weight: 500;")
-        
+        self.setStyleSheet(self._normal_qss)
+        self.text_label.setStyleSheet(text_qss)
+
         # 设置图标
         self.icon_label.setText(icon)
-        self.icon_label.setStyleSheet(f"""
-            color: {text_color};
-            font-weight: bold;
-            font-size: 12px;
-        """)
+        self.icon_label.setStyleSheet(icon_qss)
     
     def set_text(self, text: str):
         """设置状态文本"""
@@ -118,16 +160,15 @@ class StatusIndicator(QWidget):
         """切换动画状态"""
         self.animation_state = not self.animation_state
         
-        if self.animation_state:
-            # 淡化效果
-            self.setStyleSheet(self.styleSheet().replace("border-radius: 12px;", 
-                                                        "border-radius: 12px; opacity: 0.6;"))
-        else:
-            self.update_appearance()
+        # 淡化效果：在预生成的两套样式间切换
+        self.setStyleSheet(self._dim_qss if self.animation_state else self._normal_qss)
 
 
 class StatusIndicatorBar(QWidget):
     """状态指示器栏，包含多个状态指示器"""
+
+    # 自动隐藏时需要保持显示的状态（正在进行的操作）
+    _PERSISTENT = frozenset({StatusType.SAVING, StatusType.SYNCING, StatusType.MODIFIED})
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -140,6 +181,9 @@ class StatusIndicatorBar(QWidget):
         
         # 状态指示器字典
         self.indicators = {}
+
+        # 可被自动隐藏的指示器键集合
+        self._transient = set()
         
         # 自动隐藏定时器
         self.auto_hide_timer = QTimer()
@@ -151,11 +195,13 @@ class StatusIndicatorBar(QWidget):
         if key in self.indicators:
             # 如果已存在，更新状态
             self.indicators[key].set_status(status_type, text)
+            self._track_transient(key, status_type)
             return self.indicators[key]
         
         # 创建新的指示器
         indicator = StatusIndicator(status_type, text)
         self.indicators[key] = indicator
+        self._track_transient(key, status_type)
         
         # 添加到布局（在stretch之前）
         layout = self.layout()
@@ -167,6 +213,7 @@ class StatusIndicatorBar(QWidget):
         """更新状态指示器"""
         if key in self.indicators:
             self.indicators[key].set_status(status_type, text)
+            self._track_transient(key, status_type)
             self.show_indicator(key)
         else:
             # 如果指示器不存在，创建一个新的
@@ -179,6 +226,14 @@ class StatusIndicatorBar(QWidget):
             self.layout().removeWidget(indicator)
             indicator.deleteLater()
             del self.indicators[key]
+            self._transient.discard(key)
+
+    def _track_transient(self, key: str, status_type: StatusType):
+        """根据状态类型更新可自动隐藏的指示器集合"""
+        if status_type in self._PERSISTENT:
+            self._transient.discard(key)
+        else:
+            self._transient.add(key)
     
     def show_indicator(self, key: str, auto_hide_delay: int = 0):
         """显示指定的状态指示器"""
@@ -196,14 +251,16 @@ class StatusIndicatorBar(QWidget):
     
     def auto_hide_indicators(self):
         """自动隐藏所有指示器（除了正在进行的操作）"""
-        for key, indicator in self.indicators.items():
-            if indicator.status_type not in [StatusType.SAVING, StatusType.SYNCING, StatusType.MODIFIED]:
-                indicator.hide()
+        for key in self._transient:
+            self.indicators[key].hide()
     
     def clear_all(self):
         """清除所有指示器"""
+        # 批量移除期间暂停重绘，避免逐个触发布局刷新
+        self.setUpdatesEnabled(False)
         for key in list(self.indicators.keys()):
             self.remove_indicator(key)
+        self.setUpdatesEnabled(True)
 
 
 
@@ -6,271 +6,321 @@ UI组件创建模块
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QTextEdit, QLineEdit, QGroupBox, QFormLayout,
-    QFrame, QMenuBar, QToolBar, QStatusBar
+    QMenuBar, QToolBar, QStatusBar, QStackedWidget
 )
-from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QAction, QKeySequence
-from .ui_styles import UIStyles
-from .draggable_entry_list import DraggableEntryList
-from .status_indicator import StatusIndicatorBar
-
-
-class UIComponents:
-    """UI组件创建类"""
-    
-    @staticmethod
-    def create_entry_panel(main_window):
-        """创建条目列表面板"""
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(12)
-
-        # 标题区域
-        title_frame = QFrame()
-        title_frame.setFrameStyle(QFrame.Shape.NoFrame)
-        title_layout = QHBoxLayout(title_frame)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-
-        title_label = QLabel("条目列表")
-        title_label.setStyleSheet(UIStyles.get_category_title_style())
-        title_layout.addWidget(title_label)
-        title_layout.addStretch()
-        layout.addWidget(title_frame)
-
-        # 新建条目按钮
-        new_entry_btn = QPushButton("新建条目")
-        new_entry_btn.setStyleSheet(UIStyles.get_primary_button_style())
-        new_entry_btn.clicked.connect(main_window.create_new_entry)
-        layout.addWidget(new_entry_btn)
-
-        # 条目列表
-        entry_list = DraggableEntryList()
-        entry_list.itemSelectionChanged.connect(main_window.on_entry_selection_changed)
-        entry_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        entry_list.customContextMenuRequested.connect(main_window.context_menu_helper.show_entry_context_menu)
-        layout.addWidget(entry_list)
-
-        return panel, entry_list
-    
-    @staticmethod
-    def create_editor_panel(main_window):
-        """创建编辑器面板"""
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(12)
-
-        # 条目信息区域
-        info_group = QGroupBox("条目信息")
-        info_group.setStyleSheet(UIStyles.get_group_box_style())
-        info_layout = QFormLayout(info_group)
-        info_layout.setSpacing(12)
-        info_layout.setContentsMargins(16, 20, 16, 16)
-
-        # 标题输入框
-        title_label = QLabel("标题:")
-        title_label.setStyleSheet(UIStyles.get_form_label_style())
-        title_edit = QLineEdit()
-        title_edit.setPlaceholderText("请输入条目标题...")
-        title_edit.textChanged.connect(main_window.on_title_changed)
-        info_layout.addRow(title_label, title_edit)
-
-        # 标签输入框
-        tags_label = QLabel("标签:")
-        tags_label.setStyleSheet(UIStyles.get_form_label_style())
-        tags_edit = QLineEdit()
-        tags_edit.setPlaceholderText("请输入标签，用逗号分隔...")
-        tags_edit.textChanged.connect(main_window.on_tags_changed)
-        info_layout.addRow(tags_label, tags_edit)
-
-        layout.addWidget(info_group)
-
-        # 条目详细信息区域
-        details_group = QGroupBox("详细信息")
-        details_group.setStyleSheet(UIStyles.get_group_box_style())
-        details_layout = QVBoxLayout(details_group)
-        details_layout.setSpacing(8)
-        details_layout.setContentsMargins(16, 20, 16, 16)
-
-        # 创建详细信息标签
-        details_info_label = QLabel()
-        details_info_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 12px;
-                line-height: 1.4;
-                padding: 8px;
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 6px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
-        details_info_label.setWordWrap(True)
-        details_info_label.setText("请选择一个条目查看详细信息")
-        details_layout.addWidget(details_info_label)
-
-        layout.addWidget(details_group)
-
-        # 内容编辑器区域
-        content_frame = QFrame()
-        content_frame.setFrameStyle(QFrame.Shape.NoFrame)
-        content_layout = QVBoxLayout(content_frame)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(6)
-
-        content_label = QLabel("内容:")
-        content_label.setStyleSheet(UIStyles.get_content_label_style())
-        content_layout.addWidget(content_label)
-
-        content_editor = QTextEdit()
-        content_editor.setPlaceholderText("在这里编写您的内容...")
-        content_layout.addWidget(content_editor)
-
-        layout.addWidget(content_frame)
-
-        # 保存按钮和状态指示器区域
-        button_frame = QFrame()
-        button_frame.setFrameStyle(QFrame.Shape.NoFrame)
-        button_layout = QHBoxLayout(button_frame)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-        button_layout.setSpacing(12)
-
-        # 保存按钮（适中宽度）
-        save_btn = QPushButton("保存条目")
-        save_btn.setStyleSheet(UIStyles.get_save_button_style())
-        save_btn.clicked.connect(main_window.save_current_entry)
-        save_btn.setMaximumWidth(180)  # 调整按钮宽度，更协调
-        save_btn.setMinimumWidth(140)  # 设置最小宽度，确保按钮不会太小
-        button_layout.addWidget(save_btn)
-
-        # 状态指示器（移到保存按钮右侧）
-        status_indicator_bar = StatusIndicatorBar()
-        button_layout.addWidget(status_indicator_bar)
-
-        button_layout.addStretch()  # 推到左侧
-
-        layout.addWidget(button_frame)
-
-        return panel, title_edit, tags_edit, content_editor, details_info_label, status_indicator_bar
-    
-    @staticmethod
-    def create_menu_bar(main_window):
-        """创建菜单栏"""
-        menubar = main_window.menuBar()
-
-        # 文件菜单
-        file_menu = menubar.addMenu('文件(&F)')
-
-        new_entry_action = QAction('新建条目(&N)', main_window)
-        new_entry_action.setShortcut(QKeySequence.StandardKey.New)
-        new_entry_action.triggered.connect(main_window.create_new_entry)
-        file_menu.addAction(new_entry_action)
-
-        save_action = QAction('保存(&S)', main_window)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(main_window.save_current_entry)
-        file_menu.addAction(save_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction('退出(&X)', main_window)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(main_window.close)
-        file_menu.addAction(exit_action)
-
-        # 编辑菜单
-        edit_menu = menubar.addMenu('编辑(&E)')
-
-        delete_entry_action = QAction('删除条目(&D)', main_window)
-        delete_entry_action.setShortcut(QKeySequence.StandardKey.Delete)
-        delete_entry_action.triggered.connect(main_window.delete_current_entry)
-        edit_menu.addAction(delete_entry_action)
-
-        # 分类菜单
-        category_menu = menubar.addMenu('分类(&C)')
-
-        new_category_action = QAction('新建分类(&N)', main_window)
-        new_category_action.triggered.connect(main_window.create_new_category)
-        category_menu.addAction(new_category_action)
-
-        rename_category_action = QAction('重命名分类(&R)', main_window)
-        rename_category_action.triggered.connect(main_window.rename_category)
-        category_menu.addAction(rename_category_action)
-
-        delete_category_action = QAction('删除分类(&D)', main_window)
-        delete_category_action.triggered.connect(main_window.delete_category)
-        category_menu.addAction(delete_category_action)
-
-        # 搜索菜单
-        search_menu = menubar.addMenu('搜索(&S)')
-
-        search_action = QAction('搜索条目(&F)', main_window)
-        search_action.setShortcut(QKeySequence.StandardKey.Find)
-        search_action.triggered.connect(main_window.open_search_dialog)
-        search_menu.addAction(search_action)
-    
-    @staticmethod
-    def create_tool_bar(main_window):
-        """创建工具栏"""
-        toolbar = main_window.addToolBar('主工具栏')
-
-        # 新建条目
-        new_entry_action = QAction('新建条目', main_window)
-        new_entry_action.triggered.connect(main_window.create_new_entry)
-        toolbar.addAction(new_entry_action)
-
-        toolbar.addSeparator()
-
-        # 保存
-        save_action = QAction('保存', main_window)
-        save_action.triggered.connect(main_window.save_current_entry)
-        toolbar.addAction(save_action)
-
-        toolbar.addSeparator()
-
-        # 新建分类
-        new_category_action = QAction('新建分类', main_window)
-        new_category_action.triggered.connect(main_window.create_new_category)
-        toolbar.addAction(new_category_action)
-
-        toolbar.addSeparator()
-
-        # 搜索
-        search_action = QAction('搜索', main_window)
-        search_action.triggered.connect(main_window.open_search_dialog)
-        toolbar.addAction(search_action)
-
-        toolbar.addSeparator()
-
-        # 调整模式切换
-        adjust_action = QAction('调整', main_window)
-        adjust_action.setCheckable(True)
-        adjust_action.setChecked(False)
-        adjust_action.setToolTip('开启/关闭拖拽排序模式')
-        adjust_action.triggered.connect(main_window.toggle_drag_mode)
-        toolbar.addAction(adjust_action)
-
-        toolbar.addSeparator()
-
-        # 设置按钮
-        settings_action = QAction('设置', main_window)
-        settings_action.setToolTip('打开应用程序设置')
-        settings_action.triggered.connect(main_window.open_settings_dialog)
-        toolbar.addAction(settings_action)
-
-        # 保存调整按钮的引用，以便后续更新状态
-        main_window.adjust_action = adjust_action
-    
-    @staticmethod
-    def create_status_bar(main_window):
-        """创建状态栏"""
-        status_bar = main_window.statusBar()
-        return status_bar
-    
-    @staticmethod
-    def create_category_title_label():
-        """创建分类标题标签"""
-        category_title = QLabel("分类目录")
-        category_title.setStyleSheet(UIStyles.get_category_title_style())
-        return category_title
+from .ui_styles import (
+    get_content_label_style, get_group_box_style,
+    get_menu_bar_style, get_tool_bar_style, get_status_bar_style
+)
+
+
+# 标准快捷键序列缓存，首次使用时解析（需在 QApplication 创建之后）
+_STANDARD_KEY_SEQUENCES = {}
+
+
+def standard_key_sequence(standard_key: QKeySequence.StandardKey) -> QKeySequence:
+    """获取标准快捷键对应的按键序列，每个标准键只解析一次平台绑定"""
+    sequence = _STANDARD_KEY_SEQUENCES.get(standard_key)
+    if sequence is None:
+        sequence = _STANDARD_KEY_SEQUENCES[standard_key] = QKeySequence(standard_key)
+    return sequence
+
+
+class TightVBox(QVBoxLayout):
+    """预设边距和间距的垂直布局"""
+
+    def __init__(self, parent=None, margin: int = 8, spacing: int = 12):
+        super().__init__(parent)
+        self.setContentsMargins(margin, margin, margin, margin)
+        self.setSpacing(spacing)
+
+
+class TightHBox(QHBoxLayout):
+    """预设边距和间距的水平布局"""
+
+    def __init__(self, parent=None, margin: int = 8, spacing: int = 12):
+        super().__init__(parent)
+        self.setContentsMargins(margin, margin, margin, margin)
+        self.setSpacing(spacing)
+
+
+# 共享动作定义：名称 -> (动作文本, 快捷键, 主窗口槽函数名, 工具栏文本, 提示文本, 是否可勾选)
+# 菜单栏和工具栏引用同一个 QAction；Qt 由动作文本生成工具栏文本时只去掉 &，不去掉 (N) 这类括号助记符，
+# 因此带括号助记符且出现在工具栏上的动作需显式给出工具栏文本
+ACTION_SPECS = {
+    'new_entry': ('新建条目(&N)', QKeySequence.StandardKey.New, 'create_new_entry', '新建条目', None, False),
+    'save': ('保存(&S)', QKeySequence.StandardKey.Save, 'save_current_entry', '保存', None, False),
+    'exit': ('退出(&X)', QKeySequence.StandardKey.Quit, 'close', None, None, False),
+    'delete_entry': ('删除条目(&D)', QKeySequence.StandardKey.Delete, 'delete_current_entry', None, None, False),
+    'new_category': ('新建分类(&N)', None, 'create_new_category', '新建分类', None, False),
+    'rename_category': ('重命名分类(&R)', None, 'rename_category', None, None, False),
+    'delete_category': ('删除分类(&D)', None, 'delete_category', None, None, False),
+    'search': ('搜索条目(&F)', QKeySequence.StandardKey.Find, 'open_search_dialog', '搜索', None, False),
+    'adjust': ('调整', None, 'toggle_drag_mode', None, '开启/关闭拖拽排序模式', True),
+    'settings': ('设置', None, 'open_settings_dialog', None, '打开应用程序设置', False),
+}
+
+# 菜单栏定义：(菜单标题, [动作名称 或 None 表示分隔符])
+MENU_BAR_SPEC = [
+    ('文件(&F)', ['new_entry', 'save', None, 'exit']),
+    ('编辑(&E)', ['delete_entry']),
+    ('分类(&C)', ['new_category', 'rename_category', 'delete_category']),
+    ('搜索(&S)', ['search']),
+]
+
+# 工具栏定义：动作名称 或 None 表示分隔符
+TOOL_BAR_SPEC = [
+    'new_entry', None, 'save', None, 'new_category', None,
+    'search', None, 'adjust', None, 'settings',
+]
+
+
+def _make_action(main_window, text, slot, shortcut=None, checkable=False,
+                 icon_text=None, tooltip=None) -> QAction:
+    """创建并连接一个 QAction"""
+    action = QAction(text, main_window)
+    if shortcut is not None:
+        action.setShortcut(standard_key_sequence(shortcut))
+    if checkable:
+        action.setCheckable(True)
+        action.setChecked(False)
+    if icon_text:
+        action.setIconText(icon_text)
+    if tooltip:
+        action.setToolTip(tooltip)
+    action.triggered.connect(slot)
+    return action
+
+
+def _get_shared_actions(main_window) -> dict:
+    """获取菜单栏和工具栏共享的动作，首次调用时统一创建"""
+    actions = getattr(main_window, 'shared_actions', None)
+    if actions is None:
+        actions = {}
+        for name, (text, shortcut, slot_name, icon_text, tooltip, checkable) in ACTION_SPECS.items():
+            actions[name] = _make_action(
+                main_window, text, getattr(main_window, slot_name),
+                shortcut=shortcut, checkable=checkable,
+                icon_text=icon_text, tooltip=tooltip
+            )
+        main_window.shared_actions = actions
+    return actions
+
+
+def _add_action_groups(widget, action_names, actions):
+    """按分隔符切分动作名列表，每段连续动作通过一次 addActions 批量添加"""
+    group = []
+    for name in action_names:
+        if name is None:
+            if group:
+                widget.addActions(group)
+                group = []
+            widget.addSeparator()
+        else:
+            group.append(actions[name])
+    if group:
+        widget.addActions(group)
+
+
+def create_entry_panel(main_window):
+    """创建条目列表面板"""
+    panel = QWidget()
+    layout = TightVBox(panel)
+
+    # 标题区域（直接使用子布局，不额外包裹控件）
+    title_layout = QHBoxLayout()
+    title_layout.setContentsMargins(0, 0, 0, 0)
+
+    title_label = QLabel("条目列表")
+    title_label.setObjectName("categoryTitle")
+    title_layout.addWidget(title_label)
+    title_layout.addStretch()
+    layout.addLayout(title_layout)
+
+    # 新建条目按钮
+    new_entry_btn = QPushButton("新建条目")
+    new_entry_btn.setProperty("role", "primary")
+    new_entry_btn.clicked.connect(main_window.create_new_entry)
+    layout.addWidget(new_entry_btn)
+
+    # 条目列表（延迟导入，避免模块导入时加载）
+    from .draggable_entry_list import DraggableEntryList
+    entry_list = DraggableEntryList()
+    entry_list.itemSelectionChanged.connect(main_window.on_entry_selection_changed)
+    layout.addWidget(entry_list)
+
+    return panel, entry_list
+
+
+def create_editor_panel(main_window):
+    """创建编辑器面板
+
+    返回延迟构建的面板，完整编辑器在首次访问编辑控件时才创建。
+    """
+    return LazyEditorPanel(main_window)
+
+
+def _build_editor_panel_real(main_window):
+    """构建完整的编辑器面板"""
+    panel = QWidget()
+    layout = TightVBox(panel)
+
+    # 条目信息区域
+    info_group = QGroupBox("条目信息")
+    info_group.setObjectName("entryInfoGroup")
+    info_group.setStyleSheet(get_group_box_style())
+    info_layout = QFormLayout(info_group)
+    info_layout.setSpacing(12)
+    info_layout.setContentsMargins(16, 20, 16, 16)
+
+    # 标题输入框（表单标签由 QFormLayout 直接创建，样式来自全局样式表）
+    title_edit = QLineEdit()
+    title_edit.setPlaceholderText("请输入条目标题...")
+    title_edit.textChanged.connect(lambda _text: main_window.title_change_timer.start())
+    info_layout.addRow("标题:", title_edit)
+
+    # 标签输入框
+    tags_edit = QLineEdit()
+    tags_edit.setPlaceholderText("请输入标签，用逗号分隔...")
+    tags_edit.textChanged.connect(lambda _text: main_window.tags_change_timer.start())
+    info_layout.addRow("标签:", tags_edit)
+
+    layout.addWidget(info_group)
+
+    # 条目详细信息区域
+    details_group = QGroupBox("详细信息")
+    details_group.setStyleSheet(get_group_box_style())
+    details_layout = QVBoxLayout(details_group)
+    details_layout.setSpacing(8)
+    details_layout.setContentsMargins(16, 20, 16, 16)
+
+    # 创建详细信息标签
+    details_info_label = QLabel()
+    details_info_label.setObjectName("detailsInfo")
+    details_info_label.setWordWrap(True)
+    details_info_label.setText("请选择一个条目查看详细信息")
+    details_layout.addWidget(details_info_label)
+
+    layout.addWidget(details_group)
+
+    # 内容编辑器区域
+    content_layout = TightVBox(None, 0, 6)
+
+    content_label = QLabel("内容:")
+    content_label.setStyleSheet(get_content_label_style())
+    content_layout.addWidget(content_label)
+
+    content_editor = QTextEdit()
+    content_editor.setPlaceholderText("在这里编写您的内容...")
+    content_editor.textChanged.connect(main_window.on_content_changed)
+    content_layout.addWidget(content_editor)
+
+    layout.addLayout(content_layout)
+
+    # 保存按钮和状态指示器区域
+    button_layout = TightHBox(None, 0, 12)
+
+    # 保存按钮（适中宽度）
+    save_btn = QPushButton("保存条目")
+    save_btn.setProperty("role", "save")
+    save_btn.clicked.connect(main_window.save_current_entry)
+    save_btn.setMaximumWidth(180)  # 调整按钮宽度，更协调
+    save_btn.setMinimumWidth(140)  # 设置最小宽度，确保按钮不会太小
+    button_layout.addWidget(save_btn)
+
+    # 状态指示器（移到保存按钮右侧，延迟导入）
+    from .status_indicator import StatusIndicatorBar
+    status_indicator_bar = StatusIndicatorBar()
+    button_layout.addWidget(status_indicator_bar)
+
+    button_layout.addStretch()  # 推到左侧
+
+    layout.addLayout(button_layout)
+
+    return panel, title_edit, tags_edit, content_editor, details_info_label, status_indicator_bar
+
+
+def create_menu_bar(main_window):
+    """创建菜单栏"""
+    menubar = main_window.menuBar()
+    menubar.setStyleSheet(get_menu_bar_style())
+    actions = _get_shared_actions(main_window)
+
+    for menu_title, action_names in MENU_BAR_SPEC:
+        _add_action_groups(menubar.addMenu(menu_title), action_names, actions)
+
+
+def create_tool_bar(main_window):
+    """创建工具栏"""
+    toolbar = main_window.addToolBar('主工具栏')
+    toolbar.setStyleSheet(get_tool_bar_style())
+    actions = _get_shared_actions(main_window)
+
+    _add_action_groups(toolbar, TOOL_BAR_SPEC, actions)
+
+    # 保存调整按钮的引用，以便后续更新状态
+    main_window.adjust_action = actions['adjust']
+
+
+def create_status_bar(main_window):
+    """创建状态栏"""
+    status_bar = main_window.statusBar()
+    status_bar.setStyleSheet(get_status_bar_style())
+    return status_bar
+
+
+def create_category_title_label():
+    """创建分类标题标签"""
+    category_title = QLabel("分类目录")
+    category_title.setObjectName("categoryTitle")
+    return category_title
+
+
+class LazyEditorPanel(QStackedWidget):
+    """延迟构建的编辑器面板
+
+    启动时只放置一个空白占位页，首次访问编辑控件时才构建完整的编辑器并切换显示。
+    """
+
+    def __init__(self, main_window):
+        super().__init__()
+        self._main_window = main_window
+        self._widgets = None
+
+        # 占位页
+        self.addWidget(QWidget())
+
+    @property
+    def is_built(self) -> bool:
+        """编辑器是否已构建"""
+        return self._widgets is not None
+
+    def ensure_built(self):
+        """确保编辑器已构建，返回编辑控件元组"""
+        if self._widgets is None:
+            panel, *widgets = _build_editor_panel_real(self._main_window)
+            self.addWidget(panel)
+            self.setCurrentWidget(panel)
+            self._widgets = tuple(widgets)
+        return self._widgets
+
+    @property
+    def title_edit(self):
+        return self.ensure_built()[0]
+
+    @property
+    def tags_edit(self):
+        return self.ensure_built()[1]
+
+    @property
+    def content_editor(self):
+        return self.ensure_built()[2]
+
+    @property
+    def details_info_label(self):
+        return self.ensure_built()[3]
+
+    @property
+    def status_indicator_bar(self):
+        return self.ensure_built()[4]
@@ -3,687 +3,927 @@ UI样式管理模块
 负责管理应用程序的所有样式定义
 """
 
-from PyQt6.QtGui import QFont
-
-
-class UIStyles:
-    """UI样式管理类"""
-
-    # ===== 基础样式组件 =====
-
-    @staticmethod
-    def get_application_font():
-        """获取应用程序字体"""
-        return QFont("Segoe UI", 9)
-
-    @staticmethod
-    def get_base_button_style(background_color: str = "#0e639c",
-                             hover_color: str = "#1177bb",
-                             pressed_color: str = "#0d5a8a"):
-        """获取基础按钮样式
-
-        Args:
-            background_color: 背景颜色
-            hover_color: 悬停颜色
-            pressed_color: 按下颜色
-        """
-        return f"""
-            QPushButton {{
-                background-color: {background_color};
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 3px;
-                font-weight: 500;
-                font-size: 9pt;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: {pressed_color};
-            }}
-            QPushButton:disabled {{
-                background-color: #3f3f46;
-                color: #6d6d6d;
-            }}
-        """
-
-    @staticmethod
-    def get_base_input_style():
-        """获取基础输入框样式"""
-        return """
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                border: 1px solid #52525b;
-                border-radius: 3px;
-                padding: 6px 8px;
-                font-size: 9pt;
-            }
-            QLineEdit:focus {
-                border-color: #0e639c;
-            }
-        """
-
-    @staticmethod
-    def get_base_text_edit_style():
-        """获取基础文本编辑器样式"""
-        return """
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                border: 1px solid #52525b;
-                border-radius: 3px;
-                padding: 8px;
-                font-family: "Consolas", "Monaco", "Courier New", monospace;
-                font-size: 10pt;
-                line-height: 1.4;
-            }
-            QTextEdit:focus {
-                border-color: #0e639c;
-            }
-        """
-
-    @staticmethod
-    def get_base_group_box_style():
-        """获取基础分组框样式"""
-        return """
-            QGroupBox {
-                color: #e0e0e0;
-                border: 1px solid #52525b;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 4px;
-                font-weight: 500;
-                font-size: 10pt;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-                background-color: #1e1e1e;
-                color: #cccccc;
-            }
-        """
-
-    @staticmethod
-    def get_base_list_widget_style():
-        """获取基础列表控件样式"""
-        return """
-            QListWidget {
-                background-color: #252526;
-                color: #e0e0e0;
-                border: 1px solid #3f3f46;
-                border-radius: 4px;
-                selection-background-color: #37373d;
-                outline: none;
-                padding: 2px;
-            }
-            QListWidget::item {
-                padding: 6px 8px;
-                border-radius: 2px;
-                margin: 1px 0px;
-            }
-            QListWidget::item:hover {
-                background-color: #2a2d2e;
-            }
-            QListWidget::item:selected {
-                background-color: #37373d;
-            }
-        """
-
-    @staticmethod
-    def get_base_checkbox_style():
-        """获取基础复选框样式"""
-        return """
-            QCheckBox {
-                color: #e0e0e0;
-                font-size: 9pt;
-            }
-            QCheckBox::indicator {
-                width: 14px;
-                height: 14px;
-                border-radius: 2px;
-                border: 1px solid #52525b;
-                background-color: #3c3c3c;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0e639c;
-                border-color: #0e639c;
-            }
-        """
-    
-    @staticmethod
-    def get_main_stylesheet():
-        """获取主样式表，组合基础样式组件"""
-        # 组合基础样式
-        base_styles = [
-            UIStyles.get_base_button_style(),
-            UIStyles.get_base_input_style(),
-            UIStyles.get_base_text_edit_style(),
-            UIStyles.get_base_list_widget_style(),
-        ]
-
-        # 主窗口特有样式
-        main_window_styles = """
-        /* 主窗口样式 */
-        QMainWindow {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-        }
-
-        /* 菜单栏样式 */
-        QMenuBar {
-            background-color: #2d2d30;
-            color: #e0e0e0;
-            border: none;
-            padding: 2px;
-        }
-
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 8px 12px;
-            border-radius: 3px;
-        }
-
-        QMenuBar::item:selected {
-            background-color: #3f3f46;
-        }
-
-        QMenu {
-            background-color: #2d2d30;
-            color: #e0e0e0;
-            border: 1px solid #3f3f46;
-            border-radius: 4px;
-            padding: 2px;
-        }
-
-        QMenu::item {
-            padding: 6px 16px;
-            border-radius: 2px;
-        }
-
-        QMenu::item:selected {
-            background-color: #3f3f46;
-        }
-
-        /* 工具栏样式 */
-        QToolBar {
-            background-color: #2d2d30;
-            border: none;
-            spacing: 2px;
-            padding: 4px;
-        }
-
-        QToolBar QToolButton {
-            background-color: transparent;
-            color: #e0e0e0;
-            border: none;
-            padding: 6px 12px;
-            border-radius: 3px;
-            font-weight: 400;
-        }
-
-        QToolBar QToolButton:hover {
-            background-color: #3f3f46;
-        }
-
-        QToolBar QToolButton:pressed {
-            background-color: #484851;
-        }
-
-        /* 分割器样式 */
-        QSplitter::handle {
-            background-color: #3f3f46;
-            width: 1px;
-            height: 1px;
-        }
-
-        QSplitter::handle:hover {
-            background-color: #52525b;
-        }
-
-        /* 树视图样式 */
-        QTreeView {
-            background-color: #252526;
-            color: #e0e0e0;
-            border: 1px solid #3f3f46;
-            border-radius: 4px;
-            selection-background-color: #37373d;
-            outline: none;
-            padding: 2px;
-        }
-
-        QTreeView::item {
-            padding: 4px 8px;
-            border-radius: 2px;
-            margin: 1px 0px;
-        }
-
-        QTreeView::item:hover {
-            background-color: #2a2d2e;
-        }
-
-        QTreeView::item:selected {
-            background-color: #37373d;
-        }
-
-        QTreeView::branch:has-children:!has-siblings:closed,
-        QTreeView::branch:closed:has-children:has-siblings {
-            border-image: none;
-            image: url(none);
-        }
-
-        QTreeView::branch:open:has-children:!has-siblings,
-        QTreeView::branch:open:has-children:has-siblings {
-            border-image: none;
-            image: url(none);
-        }
-
-
-
-        /* 分组框样式 */
-        QGroupBox {
-            color: #e0e0e0;
-            border: 1px solid #52525b;
-            border-radius: 4px;
-            margin-top: 8px;
-            padding-top: 4px;
-            font-weight: 500;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 8px;
-            padding: 0 4px 0 4px;
-            background-color: #1e1e1e;
-        }
-
-        /* 标签样式 */
-        QLabel {
-            color: #e0e0e0;
-            font-size: 9pt;
-        }
-
-        /* 状态栏样式 */
-        QStatusBar {
-            background-color: #2d2d30;
-            color: #e0e0e0;
-            border-top: 1px solid #3f3f46;
-            padding: 2px;
-        }
-
-        /* 滚动条样式 */
-        QScrollBar:vertical {
-            background-color: #2d2d30;
-            width: 14px;
-            border-radius: 0px;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #52525b;
-            border-radius: 7px;
-            min-height: 20px;
-            margin: 2px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #6d6d6d;
-        }
-
-        QScrollBar::add-line:vertical,
-        QScrollBar::sub-line:vertical {
-            border: none;
-            background: none;
-        }
-
-        QScrollBar:horizontal {
-            background-color: #2d2d30;
-            height: 14px;
-            border-radius: 0px;
-        }
-
-        QScrollBar::handle:horizontal {
-            background-color: #52525b;
-            border-radius: 7px;
-            min-width: 20px;
-            margin: 2px;
-        }
-
-        QScrollBar::handle:horizontal:hover {
-            background-color: #6d6d6d;
-        }
-
-        QScrollBar::add-line:horizontal,
-        QScrollBar::sub-line:horizontal {
-            border: none;
-            background: none;
-        }
-        """
-
-        # 组合所有样式并返回
-        return "\n".join(base_styles) + main_window_styles
-    
-    @staticmethod
-    def get_category_title_style():
-        """获取分类标题样式"""
-        return """
-            QLabel {
-                font-size: 11pt;
-                font-weight: 600;
-                color: #cccccc;
-                padding: 6px 4px;
-                border-bottom: 1px solid #3f3f46;
-                margin-bottom: 4px;
-            }
-        """
-    
-    @staticmethod
-    def get_button_style_with_margin(margin_direction: str = "bottom", margin_size: str = "4px"):
-        """获取带边距的按钮样式
-
-        Args:
-            margin_direction: 边距方向 ("top", "bottom", "left", "right")
-            margin_size: 边距大小 (如 "4px")
-        """
-        base_style = UIStyles.get_base_button_style()
-        return base_style + f"""
-            QPushButton {{
-                margin-{margin_direction}: {margin_size};
-            }}
-        """
-
-    @staticmethod
-    def get_primary_button_style():
-        """获取主要按钮样式"""
-        return UIStyles.get_button_style_with_margin("bottom", "4px")
-
-    @staticmethod
-    def get_save_button_style():
-        """获取保存按钮样式"""
-        return UIStyles.get_button_style_with_margin("top", "4px")
-
-    @staticmethod
-    def get_group_box_style():
-        """获取分组框样式"""
-        return """
-            QGroupBox {
-                font-size: 10pt;
-                font-weight: 500;
-                color: #cccccc;
-                border: 1px solid #52525b;
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px 0 6px;
-                background-color: #1e1e1e;
-            }
-        """
-
-    @staticmethod
-    def get_form_label_style():
-        """获取表单标签样式"""
-        return "QLabel { font-weight: 500; color: #cccccc; }"
-
-    @staticmethod
-    def get_content_label_style():
-        """获取内容标签样式"""
-        return """
-            QLabel {
-                font-size: 10pt;
-                font-weight: 500;
-                color: #cccccc;
-                padding: 4px 0px;
-                border-bottom: 1px solid #3f3f46;
-                margin-bottom: 4px;
-            }
-        """
-
-    @staticmethod
-    def get_danger_button_style():
-        """获取危险按钮样式（删除等操作）"""
-        return UIStyles.get_base_button_style(
-            background_color="#dc3545",
-            hover_color="#c82333",
-            pressed_color="#bd2130"
-        )
-
-    @staticmethod
-    def get_line_edit_style():
-        """获取输入框样式"""
-        return UIStyles.get_base_input_style()
-
-    @staticmethod
-    def get_text_edit_style():
-        """获取文本编辑器样式"""
-        return UIStyles.get_base_text_edit_style()
-
-    # ===== 专用样式函数 =====
-
-    @staticmethod
-    def get_dialog_style():
-        """获取对话框样式"""
-        return """
-            QDialog {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-        """
-
-    @staticmethod
-    def get_secondary_button_style():
-        """获取次要按钮样式（灰色）"""
-        return UIStyles.get_base_button_style(
-            background_color="#6d6d6d",
-            hover_color="#7d7d7d",
-            pressed_color="#5d5d5d"
-        )
-
-    @staticmethod
-    def get_info_label_style():
-        """获取信息标签样式"""
-        return """
-            QLabel {
-                background-color: #3c3c3c;
-                border: 1px solid #52525b;
-                border-radius: 3px;
-                padding: 8px;
-                font-size: 9pt;
-                color: #cccccc;
-            }
-        """
-
-    @staticmethod
-    def get_search_input_style():
-        """获取搜索输入框样式"""
-        base_style = UIStyles.get_base_input_style()
-        return base_style.replace("padding: 6px 8px;", "padding: 8px 10px;")
-
-    @staticmethod
-    def get_preview_text_edit_style():
-        """获取预览文本编辑器样式"""
-        base_style = UIStyles.get_base_text_edit_style()
-        return base_style.replace("font-size: 10pt;", "font-size: 9pt;")
-
-    @staticmethod
-    def get_enhanced_tree_style():
-        """获取增强分类树样式"""
-        return """
-        QTreeWidget {
-            background-color: #252526;
-            color: #e0e0e0;
-            border: 1px solid #3f3f46;
-            border-radius: 4px;
-            selection-background-color: #37373d;
-            outline: none;
-            padding: 4px;
-            font-size: 9pt;
-            show-decoration-selected: 1;
-        }
-
-        QTreeWidget::item {
-            padding: 8px 6px;
-            border-radius: 3px;
-            margin: 1px 0px;
-            min-height: 26px;
-            border-left: 3px solid transparent;
-            background-color: transparent;
-        }
-
-        QTreeWidget::item:hover {
-            background-color: rgba(42, 45, 46, 0.8);
-            border-left: 3px solid #52525b;
-        }
-
-        QTreeWidget::item:selected {
-            background-color: rgba(55, 55, 61, 0.9);
-            color: #ffffff;
-            border-left: 3px solid #0e639c;
-            font-weight: 500;
-        }
-
-        QTreeWidget::item:selected:hover {
-            background-color: rgba(64, 64, 71, 0.9);
-            border-left: 3px solid #1177bb;
-        }
-
-        /* 自定义展开/折叠指示器 */
-        QTreeWidget::branch {
-            background-color: transparent;
-        }
-
-        QTreeWidget::branch:has-children:!has-siblings:closed,
-        QTreeWidget::branch:closed:has-children:has-siblings {
-            border-image: none;
-            image: none;
-            background-color: transparent;
-            width: 16px;
-        }
-
-        QTreeWidget::branch:open:has-children:!has-siblings,
-        QTreeWidget::branch:open:has-children:has-siblings {
-            border-image: none;
-            image: none;
-            background-color: transparent;
-            width: 16px;
-        }
-        """
-
-    @staticmethod
-    def get_tab_widget_style():
-        """获取选项卡控件样式"""
-        return """
-            QTabWidget::pane {
-                border: 1px solid #52525b;
-                border-radius: 4px;
-                background-color: #1e1e1e;
-                padding: 4px;
-            }
-
-            QTabBar::tab {
-                background-color: #2d2d30;
-                color: #e0e0e0;
-                border: 1px solid #52525b;
-                border-bottom: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                min-width: 80px;
-            }
-
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border-color: #0e639c;
-                font-weight: 500;
-            }
-
-            QTabBar::tab:hover:!selected {
-                background-color: #3f3f46;
-            }
-        """
-
-    @staticmethod
-    def get_dialog_button_style():
-        """获取对话框按钮样式"""
-        return """
-            QDialogButtonBox QPushButton {
-                min-width: 80px;
-                padding: 8px 16px;
-            }
-        """
-
-    @staticmethod
-    def get_spinbox_style():
-        """获取数字输入框样式"""
-        return """
-            QSpinBox {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                border: 1px solid #52525b;
-                border-radius: 3px;
-                padding: 6px 8px;
-                font-size: 9pt;
-                min-width: 60px;
-            }
-
-            QSpinBox:focus {
-                border-color: #0e639c;
-            }
-
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #52525b;
-                border: none;
-                width: 16px;
-                border-radius: 2px;
-            }
-
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #6d6d6d;
-            }
-
-            QSpinBox::up-arrow, QSpinBox::down-arrow {
-                width: 8px;
-                height: 8px;
-            }
-        """
-
-    @staticmethod
-    def get_checkbox_style():
-        """获取复选框样式"""
-        return """
-            QCheckBox {
-                color: #e0e0e0;
-                font-size: 9pt;
-                spacing: 8px;
-            }
-
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 1px solid #52525b;
-                background-color: #3c3c3c;
-            }
-
-            QCheckBox::indicator:hover {
-                border-color: #6d6d6d;
-                background-color: #484851;
-            }
-
-            QCheckBox::indicator:checked {
-                background-color: #0e639c;
-                border-color: #0e639c;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-            }
-
-            QCheckBox::indicator:checked:hover {
-                background-color: #1177bb;
-            }
-        """
+import os
+import re
+import sys
+from functools import lru_cache
+from string import Template
+
+from PyQt6.QtCore import QDir
+
+# 样式表引用的图标文件目录，注册为 "icons:" 前缀供 QSS 使用
+_ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+QDir.addSearchPath("icons", _ICONS_DIR)
+
+
+# 深色主题配色：按用途命名，取值显式驻留，各处引用的是同一个字符串对象
+COLORS = {name: sys.intern(value) for name, value in {
+    "bg_primary": "#1e1e1e",
+    "bg_panel": "#252526",
+    "bg_bar": "#2d2d30",
+    "bg_input": "#3c3c3c",
+    "bg_hover": "#2a2d2e",
+    "bg_selected": "#37373d",
+    "bg_pressed": "#484851",
+    "bg_highlight": "#3f3f46",
+    "bg_disabled": "#3f3f46",
+    "border": "#3f3f46",
+    "border_light": "#52525b",
+    "border_hover": "#6d6d6d",
+    "handle": "#52525b",
+    "handle_hover": "#6d6d6d",
+    "text": "#e0e0e0",
+    "text_muted": "#cccccc",
+    "text_bright": "#ffffff",
+    "text_dim": "#888888",
+    "text_disabled": "#6d6d6d",
+    "accent": "#0e639c",
+    "accent_hover": "#1177bb",
+    "accent_pressed": "#0d5a8a",
+    "danger": "#dc3545",
+    "danger_hover": "#c82333",
+    "danger_pressed": "#bd2130",
+    "secondary": "#6d6d6d",
+    "secondary_hover": "#7d7d7d",
+    "secondary_pressed": "#5d5d5d",
+    "status_error": "#8b5a5a",
+    "status_unknown": "#6c757d",
+}.items()}
+
+
+# 主题配色表：主题名 -> 配色（键与 COLORS 一致）
+DEFAULT_THEME = "dark"
+THEMES = {
+    DEFAULT_THEME: COLORS,
+}
+
+
+# 应用程序字体单例，首次获取时创建
+_APP_FONT = None
+
+# 首选界面字体及实际解析出的字体族名（需在 QApplication 创建之后解析）
+_PREFERRED_FONT_FAMILY = "Segoe UI"
+_APP_FONT_FAMILY = None
+
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_WHITESPACE_RE = re.compile(r"\s+")
+_QSS_PUNCTUATION_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+def _minify_qss(qss: str) -> str:
+    """压缩样式表：移除注释、合并连续空白并去掉标点两侧空白，减少 Qt 样式解析的输入长度"""
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    qss = _QSS_WHITESPACE_RE.sub(" ", qss)
+    return _QSS_PUNCTUATION_RE.sub(r"\1", qss).strip()
+
+
+# 当前主题：由 install() 设置，各样式获取函数按此主题代入配色
+_current_theme = DEFAULT_THEME
+
+
+# 以下样式常量均为含 ${颜色名} 占位符的模板，获取时代入当前主题的配色
+@lru_cache(maxsize=None)
+def _compile_qss(template: str, theme: str) -> str:
+    """将样式模板代入指定主题的配色，每个模板与主题的组合只生成一次"""
+    return Template(template).substitute(THEMES[theme])
+
+
+def _themed(template: str) -> str:
+    """按当前主题生成样式表"""
+    return _compile_qss(template, _current_theme)
+
+
+def get_current_theme() -> str:
+    """获取当前主题名称"""
+    return _current_theme
+
+
+# 主窗口特有样式
+_MAIN_WINDOW_STYLE = """
+/* 主窗口样式 */
+QMainWindow {
+    background-color: ${bg_primary};
+    color: ${text};
+}
+
+/* 弹出菜单样式（上下文菜单同样使用） */
+QMenu {
+    background-color: ${bg_bar};
+    color: ${text};
+    border: 1px solid ${border};
+    border-radius: 4px;
+    padding: 2px;
+}
+
+QMenu::item {
+    padding: 6px 16px;
+    border-radius: 2px;
+}
+
+QMenu::item:selected {
+    background-color: ${bg_highlight};
+}
+
+/* 分割器样式 */
+QSplitter::handle {
+    background-color: ${border};
+    width: 1px;
+    height: 1px;
+}
+
+QSplitter::handle:hover {
+    background-color: ${border_light};
+}
+
+/* 分组框样式 */
+QGroupBox {
+    color: ${text};
+    border: 1px solid ${border_light};
+    border-radius: 4px;
+    margin-top: 8px;
+    padding-top: 4px;
+    font-weight: 500;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 4px 0 4px;
+    background-color: ${bg_primary};
+}
+
+/* 标签样式 */
+QLabel {
+    color: ${text};
+    font-size: 9pt;
+}
+
+/* 分类标题样式 */
+QLabel#categoryTitle {
+    font-size: 11pt;
+    font-weight: 600;
+    color: ${text_muted};
+    padding: 6px 4px;
+    border-bottom: 1px solid ${border};
+    margin-bottom: 4px;
+}
+
+/* 条目信息表单标签样式 */
+QGroupBox#entryInfoGroup QLabel {
+    font-weight: 500;
+    color: ${text_muted};
+}
+
+/* 条目详细信息标签样式 */
+QLabel#detailsInfo {
+    color: ${text_dim};
+    font-size: 12px;
+    line-height: 1.4;
+    padding: 8px;
+    background-color: rgba(255, 255, 255, 0.05);
+    border-radius: 6px;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+/* 滚动条样式 */
+QScrollBar:vertical {
+    background-color: ${bg_bar};
+    width: 14px;
+    border-radius: 0px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: ${handle};
+    border-radius: 7px;
+    min-height: 20px;
+    margin: 2px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: ${handle_hover};
+}
+
+QScrollBar::add-line:vertical,
+QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+}
+
+QScrollBar:horizontal {
+    background-color: ${bg_bar};
+    height: 14px;
+    border-radius: 0px;
+}
+
+QScrollBar::handle:horizontal {
+    background-color: ${handle};
+    border-radius: 7px;
+    min-width: 20px;
+    margin: 2px;
+}
+
+QScrollBar::handle:horizontal:hover {
+    background-color: ${handle_hover};
+}
+
+QScrollBar::add-line:horizontal,
+QScrollBar::sub-line:horizontal {
+    border: none;
+    background: none;
+}
+"""
+
+
+# ===== 基础样式组件 =====
+
+def get_application_font_family() -> str:
+    """获取应用程序字体族名（首次调用时向字体数据库解析一次）
+
+    系统中存在首选字体时直接使用，否则使用系统默认界面字体，
+    避免每次构造 QFont 时由 Qt 进行字体替换匹配。
+    """
+    global _APP_FONT_FAMILY
+    if _APP_FONT_FAMILY is None:
+        from PyQt6.QtGui import QFontDatabase
+        if _PREFERRED_FONT_FAMILY in QFontDatabase.families():
+            _APP_FONT_FAMILY = _PREFERRED_FONT_FAMILY
+        else:
+            general_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont)
+            _APP_FONT_FAMILY = general_font.family()
+    return _APP_FONT_FAMILY
+
+
+def get_application_font():
+    """获取应用程序字体（单例，只创建一次）"""
+    global _APP_FONT
+    if _APP_FONT is None:
+        # 仅在首次获取字体时导入 QtGui，只需样式字符串的调用方无需加载
+        from PyQt6.QtGui import QFont
+        _APP_FONT = QFont(get_application_font_family(), 9)
+    return _APP_FONT
+
+
+# 按钮样式模板：三处颜色及主规则内的附加属性需要替换，使用 % 按名称格式化
+_BASE_BUTTON_TEMPLATE = _minify_qss("""
+    QPushButton {
+        background-color: %(background)s;
+        color: ${text_bright};
+        border: none;
+        padding: 8px 16px;
+        border-radius: 3px;
+        font-weight: 500;
+        font-size: 9pt;
+        %(extra)s
+    }
+    QPushButton:hover {
+        background-color: %(hover)s;
+    }
+    QPushButton:pressed {
+        background-color: %(pressed)s;
+    }
+    QPushButton:disabled {
+        background-color: ${bg_disabled};
+        color: ${text_disabled};
+    }
+""")
+
+
+# 相同参数返回同一模板，避免重复格式化
+@lru_cache(maxsize=32)
+def _get_button_template(background_color: str, hover_color: str,
+                         pressed_color: str, extra_props: str) -> str:
+    """生成按钮样式模板（颜色可为 ${颜色名} 占位符）"""
+    return _BASE_BUTTON_TEMPLATE % {
+        "background": background_color,
+        "hover": hover_color,
+        "pressed": pressed_color,
+        "extra": extra_props,
+    }
+
+
+def get_base_button_style(background_color: str = "${accent}",
+                         hover_color: str = "${accent_hover}",
+                         pressed_color: str = "${accent_pressed}",
+                         extra_props: str = ""):
+    """获取基础按钮样式
+
+    Args:
+        background_color: 背景颜色（可为 ${颜色名} 占位符，按当前主题取色）
+        hover_color: 悬停颜色
+        pressed_color: 按下颜色
+        extra_props: 追加到 QPushButton 主规则内的属性（如 "margin-bottom:4px;"）
+    """
+    return _themed(_get_button_template(background_color, hover_color,
+                                        pressed_color, extra_props))
+
+
+_BASE_INPUT_STYLE = _minify_qss("""
+    QLineEdit {
+        background-color: ${bg_input};
+        color: ${text};
+        border: 1px solid ${border_light};
+        border-radius: 3px;
+        padding: 6px 8px;
+        font-size: 9pt;
+    }
+    QLineEdit:focus {
+        border-color: ${accent};
+    }
+""")
+
+
+def get_base_input_style():
+    """获取基础输入框样式"""
+    return _themed(_BASE_INPUT_STYLE)
+
+
+_BASE_TEXT_EDIT_STYLE = _minify_qss("""
+    QTextEdit {
+        background-color: ${bg_primary};
+        color: ${text};
+        border: 1px solid ${border_light};
+        border-radius: 3px;
+        padding: 8px;
+        font-family: "Consolas", "Monaco", "Courier New", monospace;
+        font-size: 10pt;
+        line-height: 1.4;
+    }
+    QTextEdit:focus {
+        border-color: ${accent};
+    }
+""")
+
+
+def get_base_text_edit_style():
+    """获取基础文本编辑器样式"""
+    return _themed(_BASE_TEXT_EDIT_STYLE)
+
+
+_BASE_GROUP_BOX_STYLE = _minify_qss("""
+    QGroupBox {
+        color: ${text};
+        border: 1px solid ${border_light};
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 4px;
+        font-weight: 500;
+        font-size: 10pt;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 8px;
+        padding: 0 4px 0 4px;
+        background-color: ${bg_primary};
+        color: ${text_muted};
+    }
+""")
+
+
+def get_base_group_box_style():
+    """获取基础分组框样式"""
+    return _themed(_BASE_GROUP_BOX_STYLE)
+
+
+_BASE_LIST_WIDGET_STYLE = _minify_qss("""
+    QListWidget {
+        background-color: ${bg_panel};
+        color: ${text};
+        border: 1px solid ${border};
+        border-radius: 4px;
+        selection-background-color: ${bg_selected};
+        outline: none;
+        padding: 2px;
+    }
+    QListWidget::item {
+        padding: 6px 8px;
+        border-radius: 2px;
+        margin: 1px 0px;
+    }
+    QListWidget::item:hover {
+        background-color: ${bg_hover};
+    }
+    QListWidget::item:selected {
+        background-color: ${bg_selected};
+    }
+""")
+
+
+def get_base_list_widget_style():
+    """获取基础列表控件样式"""
+    return _themed(_BASE_LIST_WIDGET_STYLE)
+
+
+_BASE_CHECKBOX_STYLE = _minify_qss("""
+    QCheckBox {
+        color: ${text};
+        font-size: 9pt;
+    }
+    QCheckBox::indicator {
+        width: 14px;
+        height: 14px;
+        border-radius: 2px;
+        border: 1px solid ${border_light};
+        background-color: ${bg_input};
+    }
+    QCheckBox::indicator:checked {
+        background-color: ${accent};
+        border-color: ${accent};
+    }
+""")
+
+
+def get_base_checkbox_style():
+    """获取基础复选框样式"""
+    return _themed(_BASE_CHECKBOX_STYLE)
+
+
+def get_main_stylesheet():
+    """获取主样式表，组合基础样式组件
+
+    样式表在模块导入时组合一次，应在 QApplication 上整体设置一次。
+    """
+    return get_theme_stylesheet(_current_theme)
+
+
+def get_theme_stylesheet(theme: str = DEFAULT_THEME) -> str:
+    """获取指定主题的主样式表
+
+    首次请求某个主题时将配色代入模板生成一次，之后直接返回缓存结果。
+
+    Args:
+        theme: 主题名称（THEMES 中的键）
+    """
+    return _compile_qss(_MAIN_STYLESHEET_TEMPLATE, theme)
+
+
+def install(app, theme: str = DEFAULT_THEME):
+    """在应用程序上安装主样式表和字体
+
+    只在启动时调用一次，所有窗口和对话框从应用级别继承，
+    按钮变体通过 role 属性选择，不再逐个控件设置样式表。
+    之后创建的控件通过各样式获取函数取得同一主题的样式。
+
+    Args:
+        app: QApplication 实例
+        theme: 主题名称（THEMES 中的键）
+    """
+    global _current_theme
+    _current_theme = theme
+    app.setStyleSheet(get_theme_stylesheet(theme))
+    app.setFont(get_application_font())
+
+
+def get_menu_bar_style():
+    """获取菜单栏样式（设置在菜单栏控件上）"""
+    return _themed(_MENU_BAR_STYLE)
+
+
+def get_tool_bar_style():
+    """获取工具栏样式（设置在工具栏控件上）"""
+    return _themed(_TOOL_BAR_STYLE)
+
+
+def get_status_bar_style():
+    """获取状态栏样式（设置在状态栏控件上）"""
+    return _themed(_STATUS_BAR_STYLE)
+
+
+_CATEGORY_TITLE_STYLE = _minify_qss("""
+    QLabel {
+        font-size: 11pt;
+        font-weight: 600;
+        color: ${text_muted};
+        padding: 6px 4px;
+        border-bottom: 1px solid ${border};
+        margin-bottom: 4px;
+    }
+""")
+
+
+def get_category_title_style():
+    """获取分类标题样式"""
+    return _themed(_CATEGORY_TITLE_STYLE)
+
+
+def get_button_style_with_margin(margin_direction: str = "bottom", margin_size: str = "4px"):
+    """获取带边距的按钮样式
+
+    Args:
+        margin_direction: 边距方向 ("top", "bottom", "left", "right")
+        margin_size: 边距大小 (如 "4px")
+    """
+    # 边距直接并入 QPushButton 主规则，避免出现两个同选择器的规则块
+    return get_base_button_style(extra_props="margin-%s:%s;" % (margin_direction, margin_size))
+
+
+def get_primary_button_style():
+    """获取主要按钮样式"""
+    return get_button_style_with_margin("bottom", "4px")
+
+
+def get_save_button_style():
+    """获取保存按钮样式"""
+    return get_button_style_with_margin("top", "4px")
+
+
+_GROUP_BOX_STYLE = _minify_qss("""
+    QGroupBox {
+        font-size: 10pt;
+        font-weight: 500;
+        color: ${text_muted};
+        border: 1px solid ${border_light};
+        border-radius: 4px;
+        margin-top: 12px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 6px 0 6px;
+        background-color: ${bg_primary};
+    }
+""")
+
+
+def get_group_box_style():
+    """获取分组框样式"""
+    return _themed(_GROUP_BOX_STYLE)
+
+
+_FORM_LABEL_STYLE = "QLabel{font-weight:500;color:${text_muted};}"
+
+
+def get_form_label_style():
+    """获取表单标签样式"""
+    return _themed(_FORM_LABEL_STYLE)
+
+
+_CONTENT_LABEL_STYLE = _minify_qss("""
+    QLabel {
+        font-size: 10pt;
+        font-weight: 500;
+        color: ${text_muted};
+        padding: 4px 0px;
+        border-bottom: 1px solid ${border};
+        margin-bottom: 4px;
+    }
+""")
+
+
+def get_content_label_style():
+    """获取内容标签样式"""
+    return _themed(_CONTENT_LABEL_STYLE)
+
+
+def get_danger_button_style():
+    """获取危险按钮样式（删除等操作）"""
+    return get_base_button_style("${danger}", "${danger_hover}", "${danger_pressed}")
+
+
+def get_line_edit_style():
+    """获取输入框样式"""
+    return _themed(_BASE_INPUT_STYLE)
+
+
+def get_text_edit_style():
+    """获取文本编辑器样式"""
+    return _themed(_BASE_TEXT_EDIT_STYLE)
+
+
+# ===== 专用样式函数 =====
+
+_DIALOG_STYLE = _minify_qss("""
+    QDialog {
+        background-color: ${bg_primary};
+        color: ${text};
+    }
+""")
+
+
+def get_dialog_style():
+    """获取对话框样式"""
+    return _themed(_DIALOG_STYLE)
+
+
+def get_secondary_button_style():
+    """获取次要按钮样式（灰色）"""
+    return get_base_button_style("${secondary}", "${secondary_hover}", "${secondary_pressed}")
+
+
+_INFO_LABEL_STYLE = _minify_qss("""
+    QLabel {
+        background-color: ${bg_input};
+        border: 1px solid ${border_light};
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 9pt;
+        color: ${text_muted};
+    }
+""")
+
+
+def get_info_label_style():
+    """获取信息标签样式"""
+    return _themed(_INFO_LABEL_STYLE)
+
+
+# 基于基础样式派生的变体：紧随基础常量在导入时替换一次，获取函数不再扫描字符串
+_SEARCH_INPUT_STYLE = _BASE_INPUT_STYLE.replace("padding:6px 8px;", "padding:8px 10px;")
+_PREVIEW_TEXT_EDIT_STYLE = _BASE_TEXT_EDIT_STYLE.replace("font-size:10pt;", "font-size:9pt;")
+
+
+def get_search_input_style():
+    """获取搜索输入框样式"""
+    return _themed(_SEARCH_INPUT_STYLE)
+
+
+def get_preview_text_edit_style():
+    """获取预览文本编辑器样式"""
+    return _themed(_PREVIEW_TEXT_EDIT_STYLE)
+
+
+_ENHANCED_TREE_STYLE = _minify_qss("""
+QTreeWidget {
+    background-color: ${bg_panel};
+    color: ${text};
+    border: 1px solid ${border};
+    border-radius: 4px;
+    selection-background-color: ${bg_selected};
+    outline: none;
+    padding: 4px;
+    font-size: 9pt;
+    show-decoration-selected: 1;
+}
+
+QTreeWidget::item {
+    padding: 8px 6px;
+    border-radius: 3px;
+    margin: 1px 0px;
+    min-height: 26px;
+    border-left: 3px solid transparent;
+    background-color: transparent;
+}
+
+QTreeWidget::item:hover {
+    background-color: rgba(42, 45, 46, 0.8);
+    border-left: 3px solid ${border_light};
+}
+
+QTreeWidget::item:selected {
+    background-color: rgba(55, 55, 61, 0.9);
+    color: ${text_bright};
+    border-left: 3px solid ${accent};
+    font-weight: 500;
+}
+
+QTreeWidget::item:selected:hover {
+    background-color: rgba(64, 64, 71, 0.9);
+    border-left: 3px solid ${accent_hover};
+}
+
+/* 自定义展开/折叠指示器 */
+QTreeWidget::branch {
+    background-color: transparent;
+}
+
+QTreeWidget::branch:has-children:!has-siblings:closed,
+QTreeWidget::branch:closed:has-children:has-siblings {
+    border-image: none;
+    image: none;
+    background-color: transparent;
+    width: 16px;
+}
+
+QTreeWidget::branch:open:has-children:!has-siblings,
+QTreeWidget::branch:open:has-children:has-siblings {
+    border-image: none;
+    image: none;
+    background-color: transparent;
+    width: 16px;
+}
+""")
+
+
+def get_enhanced_tree_style():
+    """获取增强分类树样式"""
+    return _themed(_ENHANCED_TREE_STYLE)
+
+
+_TAB_WIDGET_STYLE = _minify_qss("""
+    QTabWidget::pane {
+        border: 1px solid ${border_light};
+        border-radius: 4px;
+        background-color: ${bg_primary};
+        padding: 4px;
+    }
+
+    QTabBar::tab {
+        background-color: ${bg_bar};
+        color: ${text};
+        border: 1px solid ${border_light};
+        border-bottom: none;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        min-width: 80px;
+    }
+
+    QTabBar::tab:selected {
+        background-color: ${bg_primary};
+        color: ${text_bright};
+        border-color: ${accent};
+        font-weight: 500;
+    }
+
+    QTabBar::tab:hover:!selected {
+        background-color: ${bg_highlight};
+    }
+""")
+
+
+def get_tab_widget_style():
+    """获取选项卡控件样式"""
+    return _themed(_TAB_WIDGET_STYLE)
+
+
+_DIALOG_BUTTON_STYLE = _minify_qss("""
+    QDialogButtonBox QPushButton {
+        min-width: 80px;
+        padding: 8px 16px;
+    }
+""")
+
+
+def get_dialog_button_style():
+    """获取对话框按钮样式"""
+    return _themed(_DIALOG_BUTTON_STYLE)
+
+
+_SPINBOX_STYLE = _minify_qss("""
+    QSpinBox {
+        background-color: ${bg_input};
+        color: ${text};
+        border: 1px solid ${border_light};
+        border-radius: 3px;
+        padding: 6px 8px;
+        font-size: 9pt;
+        min-width: 60px;
+    }
+
+    QSpinBox:focus {
+        border-color: ${accent};
+    }
+
+    QSpinBox::up-button, QSpinBox::down-button {
+        background-color: ${handle};
+        border: none;
+        width: 16px;
+        border-radius: 2px;
+    }
+
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: ${handle_hover};
+    }
+
+    QSpinBox::up-arrow, QSpinBox::down-arrow {
+        width: 8px;
+        height: 8px;
+    }
+""")
+
+
+def get_spinbox_style():
+    """获取数字输入框样式"""
+    return _themed(_SPINBOX_STYLE)
+
+
+_CHECKBOX_STYLE = _minify_qss("""
+    QCheckBox {
+        color: ${text};
+        font-size: 9pt;
+        spacing: 8px;
+    }
+
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+        border: 1px solid ${border_light};
+        background-color: ${bg_input};
+    }
+
+    QCheckBox::indicator:hover {
+        border-color: ${border_hover};
+        background-color: ${bg_pressed};
+    }
+
+    QCheckBox::indicator:checked {
+        background-color: ${accent};
+        border-color: ${accent};
+        image: url(icons:check.svg);
+    }
+
+    QCheckBox::indicator:checked:hover {
+        background-color: ${accent_hover};
+    }
+""")
+
+
+def get_checkbox_style():
+    """获取复选框样式"""
+    return _themed(_CHECKBOX_STYLE)
+
+
+# 窗口外围控件样式：直接设置在对应控件上，不放入全局样式表
+_MENU_BAR_STYLE = _minify_qss("""
+QMenuBar {
+    background-color: ${bg_bar};
+    color: ${text};
+    border: none;
+    padding: 2px;
+}
+
+QMenuBar::item {
+    background-color: transparent;
+    padding: 8px 12px;
+    border-radius: 3px;
+}
+
+QMenuBar::item:selected {
+    background-color: ${bg_highlight};
+}
+""")
+
+_TOOL_BAR_STYLE = _minify_qss("""
+QToolBar {
+    background-color: ${bg_bar};
+    border: none;
+    spacing: 2px;
+    padding: 4px;
+}
+
+QToolBar QToolButton {
+    background-color: transparent;
+    color: ${text};
+    border: none;
+    padding: 6px 12px;
+    border-radius: 3px;
+    font-weight: 400;
+}
+
+QToolBar QToolButton:hover {
+    background-color: ${bg_highlight};
+}
+
+QToolBar QToolButton:pressed {
+    background-color: ${bg_pressed};
+}
+""")
+
+_STATUS_BAR_STYLE = _minify_qss("""
+QStatusBar {
+    background-color: ${bg_bar};
+    color: ${text};
+    border-top: 1px solid ${border};
+    padding: 2px;
+}
+""")
+
+
+# 主样式表模板：组合基础样式组件与主窗口特有样式，导入时压缩一次，按主题代入配色
+_BASE_BUTTON_STYLE = _get_button_template("${accent}", "${accent_hover}", "${accent_pressed}", "")
+
+# 按钮角色样式：通过 setProperty("role", ...) 选择，无需在按钮上单独设置样式表
+# 使用 :enabled 使禁用状态仍沿用基础按钮的禁用样式
+_BUTTON_ROLE_COLOR_TEMPLATE = _minify_qss("""
+    QPushButton[role="%(role)s"]:enabled {
+        background-color: ${%(role)s};
+    }
+    QPushButton[role="%(role)s"]:hover {
+        background-color: ${%(role)s_hover};
+    }
+    QPushButton[role="%(role)s"]:pressed {
+        background-color: ${%(role)s_pressed};
+    }
+""")
+_BUTTON_ROLE_STYLE = _minify_qss("""
+    QPushButton[role="primary"] {
+        margin-bottom: 4px;
+    }
+    QPushButton[role="save"] {
+        margin-top: 4px;
+    }
+""") + "".join(
+    _BUTTON_ROLE_COLOR_TEMPLATE % {"role": role}
+    for role in ("danger", "secondary")
+)
+
+_MAIN_STYLESHEET_TEMPLATE = _minify_qss("\n".join((
+    _BASE_BUTTON_STYLE,
+    _BUTTON_ROLE_STYLE,
+    _BASE_INPUT_STYLE,
+    _BASE_TEXT_EDIT_STYLE,
+    _BASE_LIST_WIDGET_STYLE,
+    _MAIN_WINDOW_STYLE,
+)))
@@ -3,11 +3,23 @@
 """
 
 import os
-import re
 import uuid
 from typing import Optional
 
 
+# 文件名中不允许出现的字符，转换表和集合在导入时构建一次
+_UNSAFE_CHARS = '<>:"/\\|?*'
+_UNSAFE_TABLE = str.maketrans({char: '_' for char in _UNSAFE_CHARS})
+_UNSAFE_SET = frozenset(_UNSAFE_CHARS)
+
+# Windows 保留名称
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+
 def sanitize_filename(filename: str) -> str:
     """清理文件名，移除不安全字符
     
@@ -20,13 +32,8 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return ""
     
-    # 移除或替换不安全字符
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
-    
-    # 移除前后空格和点
-    filename = filename.strip('. ')
+    # 替换不安全字符（单次转换），并移除前后空格和点
+    filename = filename.translate(_UNSAFE_TABLE).strip('. ')
     
     # 确保文件名不为空
     if not filename:
@@ -48,19 +55,11 @@ def validate_filename(filename: str) -> bool:
         return False
     
     # 检查是否包含不安全字符
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        if char in filename:
-            return False
+    if not _UNSAFE_SET.isdisjoint(filename):
+        return False
     
     # 检查是否为保留名称（Windows）
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
-    if filename.upper() in reserved_names:
+    if filename.upper() in _RESERVED_NAMES:
         return False
     
     return True
@@ -109,6 +108,13 @@ def get_unique_filename(directory: str, base_name: str, extension: str = "") ->
     """
     safe_base = sanitize_filename(base_name)
     counter = 1
+
+    # 一次性读取目录中已有的文件名，候选名称在内存中比对
+    try:
+        with os.scandir(directory) as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        existing = set()
     
     while True:
         if counter == 1:
@@ -116,9 +122,11 @@ def get_unique_filename(directory: str, base_name: str, extension: str = "") ->
         else:
             filename = f"{safe_base}_{counter}{extension}"
         
-        full_path = os.path.join(directory, filename)
-        if not os.path.exists(full_path):
-            return filename
+        if os.path.normcase(filename) not in existing:
+            # 仅对选中的名称再确认一次，防止快照之后被其他操作创建
+            if not os.path.exists(os.path.join(directory, filename)):
+                return filename
+            existing.add(os.path.normcase(filename))
         
         counter += 1
         
@@ -137,20 +145,23 @@ def is_valid_path(path: str) -> bool:
     Returns:
         bool: 路径是否有效
     """
-    try:
-        # 检查路径长度（Windows限制）
-        if len(path) > 260:
-            return False
-        
-        # 检查路径中的每个部分
-        parts = path.split(os.sep)
-        for part in parts:
-            if part and not validate_filename(part):
-                return False
-        
-        return True
-    except Exception:
+    # 非字符串（如 None）视为无效路径
+    if not isinstance(path, str):
+        return False
+    
+    # 检查路径长度（Windows限制）
+    if len(path) > 260:
         return False
+    
+    # 逐段检查，遇到第一个无效部分即返回（规则同 validate_filename）
+    return not any(
+        part and (
+            not part.strip()
+            or not _UNSAFE_SET.isdisjoint(part)
+            or part.upper() in _RESERVED_NAMES
+        )
+        for part in path.split(os.sep)
+    )
 
 
 def normalize_path(path: str) -> str:
@@ -162,10 +173,6 @@ def normalize_path(path: str) -> str:
     Returns:
         str: 标准化后的路径
     """
-    # 标准化路径分隔符
-    normalized = os.path.normpath(path)
-    
-    # 移除多余的分隔符
-    normalized = re.sub(r'[/\\]+', os.sep, normalized)
-    
-    return normalized
+    # normpath 已会合并多余的分隔符（Windows 下同时统一 / 与 \），
+    # POSIX 下反斜杠是合法的文件名字符，不应改写
+    return os.path.normpath(path)
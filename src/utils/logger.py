@@ -3,14 +3,20 @@
 提供统一的日志记录功能
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
 
 class LoggerConfig:
     """日志配置类"""
+
+    # 各日志记录器对应的后台监听器，退出时统一停止以刷新队列
+    _listeners: Dict[str, QueueListener] = {}
     
     @staticmethod
     def setup_logger(name: str = "loremaster", 
@@ -45,21 +51,42 @@ class LoggerConfig:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # 文件处理器（如果指定了日志目录）
+        file_error = None
         if log_dir:
             try:
                 os.makedirs(log_dir, exist_ok=True)
                 log_file = os.path.join(log_dir, f"loremaster_{datetime.now().strftime('%Y%m%d')}.log")
                 
-                file_handler = logging.FileHandler(log_file, encoding='utf-8')
-                file_handler.setLevel(log_level)
+                # delay=True 推迟到第一条记录时才打开文件
+                file_handler = RotatingFileHandler(
+                    log_file, maxBytes=5_000_000, backupCount=5,
+                    encoding='utf-8', delay=True
+                )
                 file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                
+                # 普通记录攒批写盘，WARNING 及以上立即刷新
+                buffered_handler = MemoryHandler(
+                    1000, flushLevel=logging.WARNING, target=file_handler
+                )
+                buffered_handler.setLevel(log_level)
+                handlers.append(buffered_handler)
                 
             except (OSError, PermissionError) as e:
-                logger.warning(f"无法创建日志文件: {e}")
+                file_error = e
+        
+        # 记录器上只挂队列处理器，实际的控制台/文件写入由后台线程完成，
+        # 避免在 GUI 线程中同步写盘
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        LoggerConfig._listeners[name] = listener
+        
+        if file_error is not None:
+            logger.warning(f"无法创建日志文件: {file_error}")
         
         return logger
     
@@ -76,6 +103,19 @@ class LoggerConfig:
         """
         return logging.getLogger(name)
 
+    @staticmethod
+    def shutdown():
+        """停止所有后台日志监听器，并写出队列中剩余的日志记录"""
+        while LoggerConfig._listeners:
+            _, listener = LoggerConfig._listeners.popitem()
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+
+
+# 程序退出时确保队列中的日志全部写出
+atexit.register(LoggerConfig.shutdown)
+
 
 # 默认日志记录器
 default_logger = LoggerConfig.setup_logger()
@@ -4,9 +4,50 @@
 """
 
 import re
+import sys
 from typing import Dict
 
 
+# ASCII 范围内的字母和空白字符（与 str.isalpha / str.isspace 的判断一致）
+_ASCII_LETTERS_AND_SPACES = bytes(
+    code for code in range(128) if chr(code).isalpha() or chr(code).isspace()
+)
+# 非 ASCII 且不在中文字符范围（\u4e00-\u9fff）内的字符
+_OTHER_CHAR_PATTERN = re.compile(r'[^\x00-\x7f\u4e00-\u9fff]')
+# 英文单词（连续的 ASCII 字母）计数用的字节映射表：字母映射为 b'a'，其余字节映射为空格
+_WORD_CHAR_TABLE = bytes(
+    ord('a') if 0x41 <= code <= 0x5a or 0x61 <= code <= 0x7a else ord(' ')
+    for code in range(256)
+)
+# 没有标签时显示的文本
+_NO_TAGS = sys.intern("无")
+# 除 \n 之外 str.splitlines 也视为换行的字符
+_OTHER_LINE_BREAKS = ('\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029')
+
+
+def _count_lines(text: str) -> int:
+    """统计行数，结果与 len(text.splitlines()) 一致"""
+    if not text:
+        return 0
+    for char in _OTHER_LINE_BREAKS:
+        if char in text:
+            return len(text.splitlines())
+    # 只含 \n 换行时直接计数，无需为每一行创建子串
+    return text.count('\n') + (not text.endswith('\n'))
+
+
+def _count_english_words(data: bytes) -> int:
+    """
+    统计连续 ASCII 字母组成的单词数，结果与 len(re.findall(r'[a-zA-Z]+', text)) 一致
+
+    Args:
+        data: text.encode('ascii', 'replace') 的结果（非 ASCII 字符已替换为 '?'，仍可断开单词）
+    """
+    # 映射后每个单词以 b'a' 开头，只需统计“非字母 -> 字母”的边界，不生成匹配子串
+    marked = data.translate(_WORD_CHAR_TABLE)
+    return marked.count(b' a') + marked.startswith(b'a')
+
+
 def count_text_stats(text: str) -> Dict[str, int]:
     """
     统计文本的详细信息
@@ -27,24 +68,31 @@ def count_text_stats(text: str) -> Dict[str, int]:
         }
 
     total_chars = len(text)
-    lines = len(text.splitlines())
+    lines = _count_lines(text)
 
-    # 统计各类字符
-    chinese_chars = 0
-    english_chars = 0
-    symbols = 0
+    # 统计各类字符（扫描均在 C 层完成，不再逐字符执行 Python 分支）
+    # ASCII 字符：编码时丢弃非 ASCII 字符，剩余部分中去掉字母和空白即为符号
+    if text.isascii():
+        # 纯 ASCII 文本（标题、标签等常见情况）无需再扫描中文和其他字符
+        ascii_bytes = text.encode('ascii')
+        symbols = len(ascii_bytes.translate(None, _ASCII_LETTERS_AND_SPACES))
+        chinese_chars = 0
+        english_words = _count_english_words(ascii_bytes)
+    else:
+        ascii_bytes = text.encode('ascii', 'ignore')
+        symbols = len(ascii_bytes.translate(None, _ASCII_LETTERS_AND_SPACES))
+
+        # 非 ASCII 且不在中文范围内的字符（中文标点、全角符号、其他文字等）逐个判断类别
+        other_chars = _OTHER_CHAR_PATTERN.findall(text)
+        symbols += (len(other_chars)
+                    - sum(map(str.isalpha, other_chars))
+                    - sum(map(str.isspace, other_chars)))
 
-    for char in text:
-        if '\u4e00' <= char <= '\u9fff':  # 中文字符范围
-            chinese_chars += 1
-        elif char.isalpha():  # 英文字符
-            english_chars += 1
-        elif not char.isspace() and char != '\n' and char != '\r':  # 符号（排除空白字符和换行符）
-            symbols += 1
+        # 其余字符均为中文字符
+        chinese_chars = total_chars - len(ascii_bytes) - len(other_chars)
 
-    # 英文单词计数 - 更准确的方法
-    # 使用正则表达式匹配英文单词（连续的字母）
-    english_words = len(re.findall(r'[a-zA-Z]+', text))
+        # 英文单词计数：非 ASCII 字符替换为 '?'，保证其两侧的字母不会连成一个单词
+        english_words = _count_english_words(text.encode('ascii', 'replace'))
 
     return {
         'total_chars': total_chars,
@@ -84,9 +132,14 @@ def format_tags_display(tags: list) -> str:
         str: 格式化后的标签字符串
     """
     if not tags:
-        return "无"
+        return _NO_TAGS
     
-    if len(tags) <= 3:
-        return " | ".join(tags)
-    else:
-        return " | ".join(tags[:3]) + f" 等{len(tags)}个"
+    # 最多显示前三个标签，按数量直接拼接，避免切片和 join
+    count = len(tags)
+    if count == 1:
+        return tags[0]
+    if count == 2:
+        return f"{tags[0]} | {tags[1]}"
+    if count == 3:
+        return f"{tags[0]} | {tags[1]} | {tags[2]}"
+    return f"{tags[0]} | {tags[1]} | {tags[2]} 等{count}个"
@@ -3,9 +3,34 @@
 提供时间格式化和处理功能
 """
 
+import sys
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
+# 固定返回的提示文本，驻留为唯一实例供所有调用共享
+_UNKNOWN = sys.intern("未知")
+_FORMAT_ERROR = sys.intern("格式错误")
+_JUST_NOW = sys.intern("刚刚")
 
+# 可选依赖：安装了 ciso8601 时使用其 C 实现解析时间，否则使用标准库
+try:
+    from ciso8601 import parse_datetime as _iso_parse
+except ImportError:
+    def _iso_parse(iso_time_str: str) -> datetime:
+        # UTC 标记只会出现在末尾，只在需要时拼接，不扫描整个字符串
+        if iso_time_str.endswith('Z'):
+            iso_time_str = iso_time_str[:-1] + '+00:00'
+        return datetime.fromisoformat(iso_time_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(iso_time_str: str) -> datetime:
+    """解析ISO格式时间字符串，结果按字符串缓存（datetime 不可变，可安全共享）"""
+    return _iso_parse(iso_time_str)
+
+
+@lru_cache(maxsize=4096)
 def format_datetime_chinese(iso_time_str: str) -> str:
     """
     将ISO格式的时间字符串转换为中文友好的显示格式
@@ -17,19 +42,20 @@ def format_datetime_chinese(iso_time_str: str) -> str:
         str: 格式化后的中文时间字符串，如 "2025-04-05 20:31"
     """
     if not iso_time_str:
-        return "未知"
+        return _UNKNOWN
 
     try:
-        # 解析ISO格式时间
-        dt = datetime.fromisoformat(iso_time_str.replace('Z', '+00:00'))
+        # 解析ISO格式时间（结果只依赖输入字符串，整体已按字符串缓存）
+        dt = _parse_iso_datetime(iso_time_str)
 
         # 转换为本地时间
         local_dt = dt.astimezone()
 
-        # 格式化为中文友好格式
-        return local_dt.strftime("%Y-%m-%d %H:%M")
+        # 格式化为中文友好格式（固定格式，直接拼接字段，不经过 strftime）
+        return (f"{local_dt.year:04d}-{local_dt.month:02d}-{local_dt.day:02d} "
+                f"{local_dt.hour:02d}:{local_dt.minute:02d}")
     except (ValueError, TypeError):
-        return "格式错误"
+        return _FORMAT_ERROR
 
 
 
@@ -46,27 +72,31 @@ def get_time_ago(iso_time_str: str) -> str:
         str: 相对时间描述，如 "2小时前"、"3天前"
     """
     if not iso_time_str:
-        return "未知"
+        return _UNKNOWN
     
+    # 当前时间按秒取整，同一秒内对同一时间字符串的重复调用直接命中缓存
+    return _get_time_ago_cached(iso_time_str, int(time.time()))
+
+
+@lru_cache(maxsize=8192)
+def _get_time_ago_cached(iso_time_str: str, now_timestamp: int) -> str:
+    """按（时间字符串, 当前秒级时间戳）缓存的相对时间描述"""
     try:
         # 解析ISO格式时间
-        dt = datetime.fromisoformat(iso_time_str.replace('Z', '+00:00'))
+        dt = _parse_iso_datetime(iso_time_str)
         
         # 获取当前时间
-        now = datetime.now(timezone.utc)
+        now = datetime.fromtimestamp(now_timestamp, timezone.utc)
         
-        # 计算时间差
-        diff = now - dt
+        # 计算时间差（秒），之后只做数值比较
+        seconds = (now - dt).total_seconds()
         
-        if diff.days > 0:
-            return f"{diff.days}天前"
-        elif diff.seconds >= 3600:
-            hours = diff.seconds // 3600
-            return f"{hours}小时前"
-        elif diff.seconds >= 60:
-            minutes = diff.seconds // 60
-            return f"{minutes}分钟前"
-        else:
-            return "刚刚"
+        if seconds >= 86400:
+            return f"{int(seconds // 86400)}天前"
+        if seconds >= 3600:
+            return f"{int(seconds // 3600)}小时前"
+        if seconds >= 60:
+            return f"{int(seconds // 60)}分钟前"
+        return _JUST_NOW
     except (ValueError, TypeError):
-        return "未知"
+        return _UNKNOWN